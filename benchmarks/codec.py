@@ -0,0 +1,58 @@
+"""
+Compares the decode throughput of the JSON codecs on group member and follower pages shaped like the API's.
+
+Requires ``orjson``::
+
+    pip install -e . orjson
+    python benchmarks/codec.py
+
+Pages hold 100 entries with random names and IDs, the size :meth:`.Session.gen_pages` asks for.
+"""
+import argparse
+import json
+import random
+import string
+import timeit
+
+from roblox.codec import JSONCodec, OrjsonCodec
+
+
+def pages(seed=1):
+    rnd = random.Random(seed)
+
+    def name():
+        return "".join(rnd.choice(string.ascii_letters) for _ in range(rnd.randint(3, 20)))
+
+    members = {"previousPageCursor": None, "nextPageCursor": "abc_" + name(), "data": [{
+        "user": {"userId": rnd.randint(1, 10 ** 10), "username": name(), "displayName": name(),
+                 "buyersClub": "None"},
+        "role": {"id": rnd.randint(1, 10 ** 8), "name": name(), "rank": rnd.randint(1, 255), "memberCount": 0}
+    } for _ in range(100)]}
+
+    followers = {"previousPageCursor": None, "nextPageCursor": name(), "data": [{
+        "isOnline": False, "isDeleted": False, "description": name() * 3, "created": "2015-01-01T00:00:00.000Z",
+        "isBanned": False, "externalAppDisplayName": None, "hasVerifiedBadge": False,
+        "id": rnd.randint(1, 10 ** 10), "name": name(), "displayName": name()
+    } for _ in range(100)]}
+
+    return [("group members page", members), ("followers page", followers)]
+
+
+def main(runs):
+    for label, payload in pages():
+        body = json.dumps(payload).encode()
+
+        for codec in (JSONCodec(), OrjsonCodec()):
+            assert codec.loads(body) == payload
+
+            elapsed = timeit.timeit(lambda: codec.loads(body), number=runs)
+            print("{:20s} {:12s} {:6.1f} KB  {:7.0f} pages/s  {:6.0f} MB/s".format(
+                label, type(codec).__name__, len(body) / 1024, runs / elapsed, len(body) * runs / elapsed / 2 ** 20))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=2000)
+    args = parser.parse_args()
+
+    main(args.runs)
@@ -0,0 +1,116 @@
+"""
+Compares the throughput of the Session transports against a local server speaking HTTP/1.1 and cleartext HTTP/2.
+
+Requires ``httpx[http2]`` and ``hypercorn``::
+
+    pip install -e .[http2] hypercorn
+    python benchmarks/transports.py
+
+The server runs in a separate process and delays every response by 5ms, so the transports are measured on how they
+keep many requests in flight rather than on raw parsing speed.
+"""
+import argparse
+import asyncio
+import subprocess
+import sys
+import time
+
+import httpx
+
+from roblox.http import Session
+from roblox.ratelimit import RateLimiter
+from roblox.transport import HTTPXTransport
+
+HOST = "127.0.0.1"
+PORT = 18020
+LATENCY = 0.005
+
+
+async def app(scope, receive, send):
+    if scope["type"] != "http":
+        return
+
+    await asyncio.sleep(LATENCY)
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]})
+    await send({"type": "http.response.body", "body": b'{"id": 1, "name": "Roblox"}'})
+
+
+def serve():
+    from hypercorn.asyncio import serve as hypercorn_serve
+    from hypercorn.config import Config
+
+    config = Config()
+    config.bind = ["{}:{}".format(HOST, PORT)]
+    config.accesslog = None
+    config.keep_alive_max_requests = 10 ** 9  # hypercorn closes connections after 1000 requests by default
+    config.h2_max_concurrent_streams = 1000
+
+    asyncio.run(hypercorn_serve(app, config))
+
+
+async def wait_for_server(timeout=10.0):
+    until = time.monotonic() + timeout
+
+    while True:
+        try:
+            _, writer = await asyncio.open_connection(HOST, PORT)
+            writer.close()
+            return
+        except OSError:
+            if time.monotonic() > until:
+                raise
+            await asyncio.sleep(0.1)
+
+
+async def measure(name, requests, inflight, transport=None, **options):
+    session = Session(rate_limiter=RateLimiter(rate=None), coalesce=False, transport=transport, **options)
+    slots = asyncio.Semaphore(inflight)
+
+    async def one(i):
+        async with slots:
+            resp = await session._read("get", "http://{}:{}/v1/users/{}".format(HOST, PORT, i))
+            assert resp.status == 200
+
+    try:
+        # opens the connections before timing
+        await asyncio.gather(*(one(i) for i in range(200)))
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(requests)))
+        elapsed = time.perf_counter() - started
+    finally:
+        await session.close()
+
+    print("{:24s} {:6.0f} req/s".format(name, requests / elapsed))
+
+
+async def main(requests, inflight):
+    await wait_for_server()
+
+    await measure("aiohttp (100 conns)", requests, inflight)
+    await measure("aiohttp (500 conns)", requests, inflight, limit=500)
+    await measure("httpx http/1.1", requests, inflight, HTTPXTransport(http2=False))
+
+    # the local server has no TLS to negotiate HTTP/2 with, so the pool speaks it in cleartext (h2c)
+    h2c = HTTPXTransport()
+    h2c._pools[None] = httpx.AsyncHTTPTransport(http1=False, http2=True, limits=httpx.Limits(max_connections=100))
+    await measure("httpx http/2 (h2c)", requests, inflight, h2c)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--inflight", type=int, default=500)
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve()
+        sys.exit()
+
+    server = subprocess.Popen([sys.executable, __file__, "--serve"])
+    try:
+        asyncio.run(main(args.requests, args.inflight))
+    finally:
+        server.terminate()
+        server.wait()
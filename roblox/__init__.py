@@ -1,6 +1,6 @@
 import logging
 from roblox.client import Roblox as _Roblox
-from roblox.enums import AssetType
+from roblox.enums import AssetType, PresenceType
 
 # logging setup
 logging.basicConfig(format="%(asctime)s %(levelname)s: %(message)s")
@@ -0,0 +1,120 @@
+# Spreading read traffic over several authenticated accounts
+import itertools
+import logging
+import time
+
+log = logging.getLogger(__name__)
+
+
+class Account:
+    """
+    One authenticated :class:`.Transport` in an :class:`AccountPool`.
+    """
+
+    __slots__ = ("name", "session", "primary", "inflight", "requests", "benched_until")
+
+    def __init__(self, name, session, primary=False):
+        self.name = name
+        self.session = session
+        self.primary = primary
+
+        self.inflight = 0
+        self.requests = 0
+        self.benched_until = 0.0
+
+    def __repr__(self):
+        return "Account({!r})".format(self.name)
+
+    @property
+    def benched(self):
+        return time.monotonic() < self.benched_until
+
+    @property
+    def authenticated(self):
+        return any(cookie.key == ".ROBLOSECURITY" for cookie in self.session.cookie_jar)
+
+    def key(self, host):
+        # rate limits are per account, so each account gets its own buckets
+        return host if self.primary else "{}@{}".format(self.name, host)
+
+
+class AccountPool:
+    """
+    Accounts that read requests are spread across. Writes always use the primary account.
+
+    Args:
+        strategy: ``"round-robin"`` or ``"least-loaded"`` (fewest requests in flight).
+        bench_for: Seconds an account sits out of the rotation after being throttled, when the server doesn't say
+                   how long to wait.
+        include_primary: Whether the primary account also serves reads.
+    """
+
+    def __init__(self, strategy="round-robin", bench_for=60.0, include_primary=True):
+        if strategy not in ("round-robin", "least-loaded"):
+            raise ValueError("Unknown strategy {!r}".format(strategy))
+
+        self.strategy = strategy
+        self.bench_for = bench_for
+        self.include_primary = include_primary
+
+        self.primary = None
+        self.accounts = []
+        self._counter = itertools.count()
+
+    def __len__(self):
+        return len(self.accounts)
+
+    def add(self, name, session, primary=False):
+        account = Account(name, session, primary)
+
+        if primary:
+            self.primary = account
+        if not primary or self.include_primary:
+            self.accounts.append(account)
+
+        return account
+
+    def remove(self, name):
+        account = next((a for a in self.accounts if a.name == name and not a.primary), None)
+        if account is not None:
+            self.accounts.remove(account)
+
+        return account
+
+    def pick(self):
+        """
+        Returns the account to send the next read with, falling back to the primary account if every other account
+        is benched.
+        """
+
+        available = [a for a in self.accounts if not a.benched]
+        if not available:
+            return self.primary
+
+        if self.strategy == "least-loaded":
+            return min(available, key=lambda a: (a.inflight, a.requests))
+
+        return available[next(self._counter) % len(available)]
+
+    def bench(self, account, seconds=None):
+        """
+        Takes a throttled account out of the rotation for ``seconds``.
+        """
+
+        if account.primary and not self.include_primary:
+            return
+
+        seconds = self.bench_for if seconds is None else seconds
+        account.benched_until = max(account.benched_until, time.monotonic() + seconds)
+        log.warning("account {!r} throttled, benched for {:.1f}s".format(account.name, seconds))
+
+    def stats(self):
+        """
+        Returns ``{name: {"requests": ..., "inflight": ..., "benched": ...}}`` for every account.
+        """
+
+        return {a.name: {
+            "requests": a.requests,
+            "inflight": a.inflight,
+            "benched": a.benched
+        } for a in self.accounts}
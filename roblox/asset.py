@@ -15,15 +15,17 @@ log = logging.getLogger(__name__)
 
 
 # util decorator
-def p_info(name, nocache=False):
+def p_info(name, nocache=False, catalog=False):
     """This decorator will check if the property is in the asset's _data, and if it isn't send a request to the
-    ProductInfo API endpoint"""
+    ProductInfo API endpoint. Catalog fields are loaded in bulk with other assets first"""
 
     def decorator(fn):
         @wraps(fn)
         async def new_fn(self):
-            if nocache or self._data[name] is None:
-                await self._get_product_info()
+            if catalog and (nocache or self._data[name] is None):
+                await self._get_catalog_details(nocache, name)
+            elif nocache or self._data[name] is None:
+                await self._get_product_info(nocache)
 
             return self._data[name]
 
@@ -57,7 +59,8 @@ class Asset(_BaseAsset):
             "islimitedunique": None,
             "remaining": None,
             "serialnumber": None,
-            "creator": None
+            "creator": None,
+            "incatalog": None
         })
         self._update(data)
 
@@ -74,6 +77,9 @@ class Asset(_BaseAsset):
         return self._data["id"] == other._data["id"]
 
     def _update(self, data: dict):
+        if "itemType" in data:
+            data = self._from_catalog(data)
+
         for k in list(data.keys()):
             data[k.lower()] = data[k]
 
@@ -83,12 +89,72 @@ class Asset(_BaseAsset):
 
         self._data.update(data)
 
-    async def _get_product_info(self):
-        data = await self._state.product_info(self._data["id"])
+    @staticmethod
+    def _from_catalog(item):
+        # catalog item details use different names than product info, and leave out fields they don't have
+
+        data = {"id": item["id"], "incatalog": True}
+        for field, key in (("name", "name"), ("description", "description"), ("productid", "productId"),
+                           ("assettypeid", "assetType"), ("price", "price"), ("sales", "purchaseCount"),
+                           ("remaining", "unitsAvailableForConsumption")):
+            if key in item:
+                data[field] = item[key]
+
+        if item.get("isOffSale") is not None:
+            data["isforsale"] = not item["isOffSale"]
+        if "priceStatus" in item:
+            data["ispublicdomain"] = item["priceStatus"] == "Free"
+        if "itemRestrictions" in item:
+            restrictions = item["itemRestrictions"] or []
+            data["islimited"] = "Limited" in restrictions
+            data["islimitedunique"] = "LimitedUnique" in restrictions
+
+        if item.get("creatorTargetId") is not None:
+            data["creator"] = {
+                "Id": item["creatorTargetId"],
+                "Name": item.get("creatorName"),
+                "CreatorType": item.get("creatorType"),
+                "CreatorTargetId": item["creatorTargetId"]
+            }
+
+        return data
+
+    async def _get_product_info(self, nocache=False):
+        asset_id = self._data["id"]
+        data = await self._state.stored("asset", asset_id, lambda: self._state.product_info(asset_id), nocache)
         self._update(data)
 
+    async def _get_catalog_details(self, nocache=False, field=None):
+        asset_id = self._data["id"]
+
+        if self._data["incatalog"] is False:
+            return await self._get_product_info(nocache)
+
+        store = self._state.store
+        if not nocache and store is not None and store.get("catalog", asset_id) is None \
+                and store.get("asset", asset_id) is not None:
+            return await self._get_product_info()
+
+        try:
+            data = await self._state.stored("catalog", asset_id, lambda: self._state.load_catalog_details(asset_id),
+                                            nocache)
+        except AssetNotFound:
+            # not an avatar item
+            self._data["incatalog"] = False
+            await self._get_product_info(nocache)
+        except OfflineError:
+            # the product info may be stored
+            await self._get_product_info(nocache)
+        else:
+            details = self._from_catalog(data)
+            self._update(dict(details))
+
+            if field is not None and field not in details:
+                # the catalog doesn't have this field, product info does
+                await self._get_product_info()
+
     @async_property
-    @p_info("name")
+    @p_info("name", catalog=True)
     async def name(self):
         """|asyncprop|
 
@@ -100,7 +166,7 @@ class Asset(_BaseAsset):
         pass
 
     @async_property
-    @p_info("description")
+    @p_info("description", catalog=True)
     async def description(self):
         """|asyncprop|
 
@@ -133,7 +199,7 @@ class Asset(_BaseAsset):
         """
 
         if self._data["assettypeid"] is None:
-            await self._get_product_info()
+            await self._get_catalog_details(field="assettypeid")
 
         return AssetType(self._data["assettypeid"])
 
@@ -150,7 +216,7 @@ class Asset(_BaseAsset):
         return "https://roblox.com/library/{}/{}".format(await self.id, safe_name)
 
     @async_property
-    @p_info("productid")
+    @p_info("productid", catalog=True)
     async def product_id(self):
         """|asyncprop|
 
@@ -196,7 +262,7 @@ class Asset(_BaseAsset):
             return None
 
     @async_property
-    @p_info("price", nocache=True)
+    @p_info("price", nocache=True, catalog=True)
     async def price(self):
         """|asyncprop|
 
@@ -208,7 +274,7 @@ class Asset(_BaseAsset):
         pass
 
     @async_property
-    @p_info("sales", nocache=True)
+    @p_info("sales", nocache=True, catalog=True)
     async def sales(self):
         """|asyncprop|
 
@@ -229,7 +295,7 @@ class Asset(_BaseAsset):
         """
 
         if self._data["isforsale"] is None and self._data["ispublicdomain"] is None:
-            await self._get_product_info()
+            await self._get_catalog_details(field="isforsale")
 
         return self._data["isforsale"] or self._data["ispublicdomain"]
 
@@ -243,11 +309,11 @@ class Asset(_BaseAsset):
         """
 
         if self._data["creator"] is None:
-            await self._get_product_info()
+            await self._get_catalog_details(field="creator")
 
         creator = self._data["creator"]
-        if creator.get("CreatorType") == "User":
-            return await self._state.client.get_user(username=creator["Name"])
+        if creator.get("creatortype") == "User":
+            return await self._state.client.get_user(username=creator["name"])
 
     @async_property
     async def favorites(self):
@@ -260,6 +326,20 @@ class Asset(_BaseAsset):
 
         return await self._state.favorites_count(await self.id)
 
+    async def thumbnail(self, size="420x420", format="Png"):
+        """|coro|
+
+        URL of the asset's thumbnail image, or ``None`` if it isn't available.
+
+        Args:
+            size: Image size, e.g. ``"420x420"``.
+            format: ``"Png"`` or ``"Jpeg"``.
+
+        :rtype: str
+        """
+
+        return await self._state.get_thumbnail("thumbnails.assets", await self.id, size, format)
+
     @async_property
     async def is_favorited(self):
         """|asyncprop|
@@ -0,0 +1,121 @@
+# Collecting single lookups into bulk requests
+import asyncio
+
+from roblox.deadline import within_deadline, without_deadline
+from roblox.scheduler import current as current_schedule, scheduling
+
+
+class Batcher:
+    """
+    Collects lookups made within ``window`` seconds of each other and resolves them with a single call to
+    ``fetch``, like a DataLoader. Lookups of a key that's already waiting or in flight share its result.
+
+    Batches are sent outside of their callers' deadlines, each caller's deadline only limits its own wait. A batch is
+    scheduled with the most urgent priority class and tenant of the lookups in it.
+
+    Args:
+        fetch: Coroutine function taking a list of up to ``max_size`` keys and returning a mapping of key to result.
+        max_size: Max number of keys per call. A full batch is sent without waiting for the window to end.
+        window: Seconds to wait for more lookups before sending a batch.
+        missing: Called with a key missing from ``fetch``'s result, returns the exception its lookup fails with.
+
+    Attributes:
+        stats: Number of ``loads``, ``batches`` sent and loads ``shared`` with a lookup of the same key.
+    """
+
+    def __init__(self, fetch, max_size=100, window=0.01, missing=KeyError):
+        self.fetch = fetch
+        self.max_size = max_size
+        self.window = window
+        self.missing = missing
+
+        self._futures = {}  # key -> future, until resolved
+        self._queue = []  # keys not sent yet
+        self._schedules = {}  # key not sent yet -> most urgent (priority, tenant) it was looked up with
+        self._timer = None
+
+        self.stats = {
+            "loads": 0,
+            "batches": 0,
+            "shared": 0
+        }
+
+    async def load(self, key):
+        """|coro|
+
+        Returns the result for ``key``.
+        """
+
+        self.stats["loads"] += 1
+
+        schedule = current_schedule()
+
+        fut = self._futures.get(key)
+        if fut is not None:
+            self.stats["shared"] += 1
+
+            queued = self._schedules.get(key)
+            if queued is not None and schedule[0] < queued[0]:
+                self._schedules[key] = schedule
+        else:
+            loop = asyncio.get_running_loop()
+
+            fut = self._futures[key] = loop.create_future()
+            fut.add_done_callback(_retrieve)
+            self._queue.append(key)
+            self._schedules[key] = schedule
+
+            if len(self._queue) >= self.max_size:
+                self._dispatch()
+            elif self._timer is None:
+                self._timer = loop.call_later(self.window, self._dispatch, context=without_deadline())
+
+        # one waiter being cancelled mustn't cancel the others
+        return await within_deadline(asyncio.shield(fut))
+
+    async def load_many(self, keys):
+        """|coro|
+
+        Returns the results for several keys, in order. Failed lookups are returned as their exception.
+        """
+
+        return await asyncio.gather(*(self.load(key) for key in keys), return_exceptions=True)
+
+    def _dispatch(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        while self._queue:
+            keys, self._queue = self._queue[:self.max_size], self._queue[self.max_size:]
+            self.stats["batches"] += 1
+
+            schedule = min((self._schedules.pop(key) for key in keys), key=lambda s: s[0])
+            without_deadline().run(asyncio.ensure_future, self._run(keys, schedule))
+
+    async def _run(self, keys, schedule):
+        try:
+            with scheduling(*schedule):
+                results = await self.fetch(keys)
+        except Exception as e:
+            results, error = {}, e
+        else:
+            error = None
+
+        for key in keys:
+            fut = self._futures.pop(key)
+            if fut.done():
+                continue
+
+            if error is not None:
+                fut.set_exception(error)
+            elif key in results:
+                fut.set_result(results[key])
+            else:
+                fut.set_exception(self.missing(key))
+
+
+def _retrieve(fut):
+    # marks a failure as seen, for futures whose only waiters were cancelled
+    if not fut.cancelled():
+        fut.exception()
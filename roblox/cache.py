@@ -0,0 +1,143 @@
+# In-memory cache for GET responses
+import logging
+import time
+from collections import OrderedDict
+from fnmatch import fnmatch
+
+from yarl import URL
+
+log = logging.getLogger(__name__)
+
+# rough per-entry overhead on top of the body, so tiny responses still count towards the limit
+ENTRY_OVERHEAD = 256
+
+
+class CacheEntry:
+    __slots__ = ("response", "expires", "size")
+
+    def __init__(self, response, ttl):
+        self.response = response
+        self.expires = time.monotonic() + ttl
+        self.size = len(response.body) + len(str(response.url)) + ENTRY_OVERHEAD
+
+    @property
+    def fresh(self):
+        return time.monotonic() < self.expires
+
+    @property
+    def validators(self):
+        # conditional request headers to revalidate this entry with
+
+        headers = {}
+        etag = self.response.headers.get("ETag")
+        modified = self.response.headers.get("Last-Modified")
+
+        if etag:
+            headers["If-None-Match"] = etag
+        if modified:
+            headers["If-Modified-Since"] = modified
+
+        return headers
+
+
+class ResponseCache:
+    """
+    LRU cache of successful GET responses, bounded by the total size of the cached bodies.
+
+    Stale entries that came with an ``ETag`` or ``Last-Modified`` header are kept and revalidated with a
+    conditional request, so a ``304 Not Modified`` reuses the cached body. Pass ``cache=False`` to
+    :meth:`.Session.req` to bypass the cache for a single call; writes to a URL drop its cached responses.
+
+    Args:
+        ttl: Default number of seconds a response stays fresh. ``0`` only caches endpoints listed in ``ttls``.
+        ttls: Mapping of URL pattern to TTL, e.g. ``{"groups.roblox.com/v1/groups/*/roles": 300}``. Patterns are
+              matched against the host and path with :func:`fnmatch.fnmatch`, first match wins.
+        max_bytes: Max total size of the cached responses. Least recently used entries are evicted first.
+
+    Attributes:
+        stats: Number of ``hits``, ``misses``, ``revalidated`` (304) responses and ``evictions``.
+    """
+
+    def __init__(self, ttl=30.0, ttls=None, max_bytes=16 * 1024 * 1024):
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self.max_bytes = max_bytes
+
+        self.size = 0
+        self._entries = OrderedDict()
+
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "revalidated": 0,
+            "evictions": 0
+        }
+
+    def __len__(self):
+        return len(self._entries)
+
+    def ttl_for(self, url):
+        """
+        Returns the TTL that applies to a URL.
+        """
+
+        if self.ttls:
+            url = URL(url)
+            target = "{}{}".format(url.host, url.path)
+
+            for pattern, ttl in self.ttls.items():
+                if fnmatch(target, pattern):
+                    return ttl
+
+        return self.ttl
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+
+        return entry
+
+    def put(self, key, response, ttl):
+        self.pop(key)
+
+        entry = CacheEntry(response, ttl)
+        if entry.size > self.max_bytes:
+            return
+
+        self._entries[key] = entry
+        self.size += entry.size
+
+        while self.size > self.max_bytes:
+            _, old = self._entries.popitem(last=False)
+            self.size -= old.size
+            self.stats["evictions"] += 1
+
+    def refresh(self, key, ttl):
+        # entry was revalidated by the server
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry.expires = time.monotonic() + ttl
+
+        return entry
+
+    def pop(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry.size
+
+        return entry
+
+    def invalidate(self, url=None):
+        """
+        Drops every cached response for ``url`` (any params), or the whole cache if no URL is given.
+        """
+
+        if url is None:
+            self._entries.clear()
+            self.size = 0
+            return
+
+        url = str(url)
+        for key in [k for k in self._entries if k[1] == url]:
+            self.pop(key)
@@ -0,0 +1,131 @@
+# Per-host circuit breakers
+import logging
+import time
+from collections import deque
+
+from roblox.errors import CircuitOpen
+
+log = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+class _HostCircuit:
+    __slots__ = ("state", "outcomes", "failures", "opened_at", "probe_at")
+
+    def __init__(self):
+        self.state = CLOSED
+        self.outcomes = deque()  # (time, failed) within the window
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probe_at = None
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for each API host, so an outage on one host fails fast instead of tying up connections.
+
+    A closed circuit lets requests through and opens once at least ``min_requests`` requests were made in the last
+    ``window`` seconds and ``error_rate`` of them failed with a connection error, timeout or 5xx response. An open
+    circuit fails every request immediately with :class:`.CircuitOpen`. After ``open_for`` seconds it turns
+    half-open and lets a single probe request through: success closes the circuit, failure opens it again.
+
+    Args:
+        error_rate: Share of failed requests that opens the circuit.
+        min_requests: Min number of requests in the window before the circuit can open.
+        window: Seconds of history the error rate is computed over.
+        open_for: Seconds a circuit stays open before probing the host.
+        listeners: Callables called with ``(host, old_state, new_state)`` on every transition.
+    """
+
+    def __init__(self, error_rate=0.5, min_requests=20, window=30.0, open_for=10.0, listeners=None):
+        self.error_rate = error_rate
+        self.min_requests = min_requests
+        self.window = window
+        self.open_for = open_for
+        self.listeners = list(listeners or [])
+
+        self._hosts = {}
+
+    def _host(self, host):
+        circuit = self._hosts.get(host)
+        if circuit is None:
+            circuit = self._hosts[host] = _HostCircuit()
+
+        return circuit
+
+    def states(self):
+        """
+        Returns ``{host: state}`` for every host seen, where state is ``"closed"``, ``"open"`` or ``"half-open"``.
+        """
+
+        return {host: circuit.state for host, circuit in self._hosts.items()}
+
+    def check(self, host):
+        """
+        Raises :class:`.CircuitOpen` if requests to ``host`` shouldn't be sent right now.
+        """
+
+        circuit = self._host(host)
+        if circuit.state == CLOSED:
+            return
+
+        now = time.monotonic()
+
+        if circuit.state == OPEN:
+            if now - circuit.opened_at < self.open_for:
+                raise CircuitOpen("Circuit for {} is open".format(host))
+
+            self._transition(host, circuit, HALF_OPEN)
+
+        # one probe at a time, a probe that never reported back expires
+        if circuit.probe_at is not None and now - circuit.probe_at < self.open_for:
+            raise CircuitOpen("Circuit for {} is half-open, waiting on a probe".format(host))
+
+        circuit.probe_at = now
+
+    def record(self, host, latency=None, status=None, error=False):
+        """
+        Records the outcome of a request to ``host``: its response ``status``, or ``error`` if it failed without a
+        response. Recording without an outcome (e.g. when cancelled) only frees a half-open probe.
+        """
+
+        circuit = self._host(host)
+
+        if status is None and not error:
+            circuit.probe_at = None
+            return
+
+        failed = error or status >= 500
+
+        if circuit.state == HALF_OPEN:
+            circuit.probe_at = None
+            self._transition(host, circuit, OPEN if failed else CLOSED)
+        elif circuit.state == CLOSED:
+            now = time.monotonic()
+            circuit.outcomes.append((now, failed))
+            circuit.failures += failed
+
+            while circuit.outcomes and circuit.outcomes[0][0] < now - self.window:
+                circuit.failures -= circuit.outcomes.popleft()[1]
+
+            total = len(circuit.outcomes)
+            if total >= self.min_requests and circuit.failures >= self.error_rate * total:
+                self._transition(host, circuit, OPEN)
+
+    def _transition(self, host, circuit, state):
+        old = circuit.state
+        circuit.state = state
+
+        if state == OPEN:
+            circuit.opened_at = time.monotonic()
+        elif state == CLOSED:
+            circuit.outcomes.clear()
+            circuit.failures = 0
+
+        log.warning("circuit for {} {} -> {}".format(host, old, state))
+
+        for listener in self.listeners:
+            listener(host, old, state)
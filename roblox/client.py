@@ -1,18 +1,22 @@
 from __future__ import annotations
 
+import asyncio
 import re
+import time
 from typing import Union
 
 from cached_property import cached_property
 
 from roblox.asset import Asset
+from roblox.deadline import deadline
 from roblox.enums import AssetType
 from roblox.errors import *
 from roblox.game import Place, Universe
 from roblox.group import Group
 from roblox.http import Session
 from roblox.iterables import AsyncIterator
-from roblox.user import ClientUser, User, FriendRequest
+from roblox.scheduler import scheduling
+from roblox.user import BaseUser, ClientUser, User, FriendRequest, Presence
 
 id_re = re.compile(r"/(\d+)/")
 
@@ -22,12 +26,46 @@ class Roblox:
     Represents the connection to the Roblox API.
     This object is used to authorize with Roblox, as well as fetch personal data and specific users, assets,
     groups, and games.
+
+    Keyword Args:
+        rate_limiter: :class:`.RateLimiter` used to throttle requests to each API host.
+        retry_policy: :class:`.RetryPolicy` used to retry idempotent requests that fail.
+        coalesce: Whether identical GET requests in flight at the same time share one request. Defaults to ``True``.
+        cache: :class:`.ResponseCache` for GET responses, or ``True`` for one with default settings. Responses aren't
+               cached by default.
+        store: :class:`.EntityStore` that users, groups, assets and games are loaded through.
+        concurrency: :class:`.AIMDLimiter` adapting the number of requests in flight to each host, or ``True`` for
+                     one with default settings.
+        scheduler: :class:`.Scheduler` ordering requests by priority class and tenant, or ``True`` for one with
+                   default settings.
+        hedger: :class:`.Hedger` duplicating slow GET requests, or ``True`` for one with default settings.
+        breaker: :class:`.CircuitBreaker` failing fast on hosts with an outage, or ``True`` for one with default
+                 settings.
+        accounts: :class:`.AccountPool` deciding how reads are spread over accounts added with
+                  :meth:`add_account`.
+        proxies: :class:`.ProxyPool` requests are sent through, or a list of proxy URLs for one with default
+                 settings.
+        transport: :class:`.Transport` sending the requests, e.g. :class:`.HTTPXTransport` for HTTP/2. Defaults to
+                   aiohttp.
+        codec: :class:`.JSONCodec` encoding payloads and decoding responses. Defaults to :class:`.OrjsonCodec` if
+               orjson is installed.
+        batch_window: Seconds user, asset, place, universe, group and role lookups wait to be sent together in one
+                      bulk request. Defaults to 10ms.
+        thumbnail_cache: :class:`.ThumbnailCache` for thumbnail URLs, or ``None`` to request them every time.
+                         Defaults to one with default settings.
+        connector: Connection pool shared with other clients, see :func:`.make_connector`. Only used by the default
+                   transport, like the options below.
+        limit: Max number of open connections, when not sharing a connector.
+        limit_per_host: Max number of open connections to a single host.
+        keepalive_timeout: Seconds idle connections are kept open for reuse.
+        dns_cache_ttl: Seconds DNS lookups are cached for.
+        resolver: aiohttp resolver, or ``True`` to use :class:`aiohttp.AsyncResolver`.
     """
 
-    def __init__(self):
+    def __init__(self, **options):
         self.username = ""
 
-        self._state = Session()
+        self._state = Session(**options)
         self._state.client = self
 
     async def login(self, username: str, password: str):
@@ -60,6 +98,85 @@ class Roblox:
         self.username = username
         await self.user._get_profile_data()  # necessary for equality checks
 
+    def export_session(self) -> dict:
+        """
+        Exports the client's authorized session: its cookies, XSRF token, username and user ID. The returned dict is
+        JSON serializable, so it can be saved and passed to :meth:`import_session` when the program restarts,
+        skipping the login.
+
+        Returns:
+            Session state. It holds the .ROBLOSECURITY cookie, so keep it as secret as a password.
+        """
+
+        state = self._state.export_state()
+        state["username"] = self.username
+        state["user_id"] = self.user._data.get("id")
+
+        return state
+
+    def import_session(self, state: dict):
+        """
+        Restores a session exported with :meth:`export_session` without sending any requests. The session is checked
+        once before the first request made with it, which raises :class:`.AuthError` if it has expired.
+
+        Args:
+            state: Session state from :meth:`export_session`.
+        """
+
+        self._state.import_state(state)
+
+        self.username = state["username"]
+        self.__dict__.pop("user", None)  # cached ClientUser of the previous session
+        self.user._data["id"] = state.get("user_id")
+
+    async def add_account(self, username: str, security_token: str):
+        """|coro|
+
+        Adds another account, authorized using a .ROBLOSECURITY cookie, to spread read requests across. Accounts
+        that get rate limited sit out of the rotation for a while. Writes always use the account the client logged
+        in with.
+
+        Args:
+            username: Username the token belongs to.
+            security_token: Token to authorize with.
+        """
+
+        await self._state.add_account(username, security_token)
+
+    async def warmup(self, hosts: list = None, connections: int = 1, every: float = None) -> dict:
+        """|coro|
+
+        Opens pooled connections to the API hosts concurrently, so the first requests after startup don't pay for
+        DNS lookups and TLS handshakes::
+
+            timings = await client.warmup(hosts=["users.roblox.com", "groups.roblox.com"], every=25)
+
+        With ``proxies`` set the connections are opened through every healthy proxy, since that's where requests go.
+
+        Args:
+            hosts: Host names or base URLs to connect to. Defaults to every API host.
+            connections: Number of connections to open to each host, through each proxy.
+            every: Seconds between warm-ups repeated in the background, replacing connections the pool dropped for
+                   being idle. Should be below the connector's ``keepalive_timeout``.
+
+        Returns:
+            Mapping of host to the seconds it took to connect, or to the exception if it couldn't be reached.
+        """
+
+        return await self._state.warmup(hosts, connections, every)
+
+    async def check_proxies(self) -> dict:
+        """|coro|
+
+        Sends a request through every proxy in the client's :class:`.ProxyPool`, ejecting the ones that fail and
+        readmitting ejected ones that work again.
+
+        Returns:
+            Mapping of proxy URL to whether it's healthy.
+        """
+
+        return await self._state.check_proxies()
+
     async def logged_in(self) -> bool:
         """|coro|
 
@@ -81,6 +198,31 @@ class Roblox:
     async def close(self):
         await self._state.close()
 
+    def priority(self, priority, tenant=None):
+        """
+        Context manager that tags the requests made inside it with a priority class (``"interactive"``,
+        ``"default"`` or ``"bulk"``) and a tenant name for the client's :class:`.Scheduler`::
+
+            with client.priority("interactive", tenant="commands"):
+                member = await group.get_member(username)
+
+        Iterators are tagged with :meth:`.AsyncIterator.scheduled`.
+        """
+
+        return scheduling(priority, tenant)
+
+    def deadline(self, seconds: float):
+        """
+        Context manager giving every request made inside it one shared time budget::
+
+            with client.deadline(2):
+                member = await group.get_member(username)
+
+        Raises :class:`.DeadlineExceeded` if the budget runs out.
+        """
+
+        return deadline(seconds)
+
     @cached_property
     def user(self) -> ClientUser:
         """
@@ -125,11 +267,26 @@ class Roblox:
         if isinstance(asset_id, str):
             asset_id = int(id_re.search(asset_id).group(1))
 
-        p_info = await self._state.product_info(asset_id)
+        store = self._state.store
+        incatalog = None
+
+        # stored product info is used before asking the catalog
+        if store is None or store.get("catalog", asset_id) is not None or store.get("asset", asset_id) is None:
+            try:
+                # avatar items are loaded in bulk with other assets
+                details = await self._state.stored("catalog", asset_id,
+                                                   lambda: self._state.load_catalog_details(asset_id))
+                return Asset(state=self._state, data=dict(details))
+            except AssetNotFound:
+                incatalog = False
+            except OfflineError:
+                pass
+
+        p_info = await self._state.stored("asset", asset_id, lambda: self._state.product_info(asset_id))
         if p_info["AssetTypeId"] == AssetType.Place:
             return Place(state=self._state, data=p_info)
 
-        return Asset(state=self._state, data=p_info)
+        return Asset(state=self._state, data=dict(p_info, incatalog=incatalog))
 
     async def get_universe(self, universe_id, *, data=None) -> Universe:
         """|coro|
@@ -163,6 +320,62 @@ class Roblox:
             _data.update(**data)
         return Group(state=self._state, data=_data)
 
+    async def presence(self, users) -> dict:
+        """|coro|
+
+        Gets where several users are online, sending the lookups together in as few requests as possible.
+
+        Args:
+            users: Users or user IDs.
+
+        Returns:
+            Mapping of user ID to :class:`.Presence`. Users that couldn't be found are left out.
+        """
+
+        async def lookup(user):
+            # users given by name are resolved together, then batched with the other presence lookups
+            try:
+                user_id = await user.id if isinstance(user, BaseUser) else int(user)
+                return user_id, await self._state.get_presence(user_id)
+            except UserIdentificationError:
+                return None
+
+        results = await asyncio.gather(*(lookup(user) for user in users))
+
+        return {result[0]: Presence(result[1]) for result in results if result is not None}
+
+    def watch_presence(self, users, interval=30.0) -> AsyncIterator:
+        """
+        :class:`.AsyncIterator` polling the presence of several users every ``interval`` seconds, yielding only
+        the presences that changed since the previous poll. The first poll yields every user's presence::
+
+            async for presence in client.watch_presence(staff):
+                if presence.type == PresenceType.InGame:
+                    print(presence.user_id, "joined", presence.location)
+
+        Args:
+            users: Users or user IDs.
+            interval: Seconds between the start of two polls.
+
+        Yields:
+            :class:`.Presence`
+        """
+
+        async def gen():
+            last = {}
+
+            while True:
+                started = time.monotonic()
+
+                for user_id, presence in (await self.presence(users)).items():
+                    if last.get(user_id) != presence:
+                        last[user_id] = presence
+                        yield presence
+
+                await asyncio.sleep(max(0.0, interval - (time.monotonic() - started)))
+
+        return AsyncIterator(gen=gen(), state=self._state)
+
     @property
     def blocked(self) -> AsyncIterator:
         """
@@ -0,0 +1,66 @@
+# Single-flight coalescing of identical requests
+import asyncio
+
+from roblox.deadline import within_deadline, without_deadline
+
+
+def request_key(method, url, params=None):
+    # identifies requests that would return the same response
+
+    if isinstance(params, dict):
+        params = tuple(sorted((str(k), str(v)) for k, v in params.items()))
+    elif params is not None:
+        params = tuple((str(k), str(v)) for k, v in params)
+
+    return method.upper(), str(url), params
+
+
+class Coalescer:
+    """
+    Shares one in-flight request between every caller asking for the same thing at the same time.
+
+    The first caller starts the request; callers arriving before it finishes wait on the same task and get the same
+    result (or exception). The task isn't cancelled when its first caller is, so it keeps serving the others. It runs
+    with the first caller's scheduling but outside of its deadline, each caller's deadline only limits its own wait.
+
+    Attributes:
+        stats: Number of ``requests`` actually sent and number of requests ``saved`` by sharing one in flight.
+    """
+
+    def __init__(self):
+        self._inflight = {}
+
+        self.stats = {
+            "requests": 0,
+            "saved": 0
+        }
+
+    def __len__(self):
+        return len(self._inflight)
+
+    async def run(self, key, factory):
+        """|coro|
+
+        Returns the result of the in-flight task for ``key``, calling ``factory()`` to start one if there isn't one.
+        """
+
+        task = self._inflight.get(key)
+
+        if task is None:
+            self.stats["requests"] += 1
+
+            task = without_deadline().run(asyncio.ensure_future, factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._done(key, t))
+        else:
+            self.stats["saved"] += 1
+
+        return await within_deadline(asyncio.shield(task))
+
+    def _done(self, key, task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+        # mark the exception retrieved in case every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,52 @@
+# JSON encoding of request payloads and decoding of response bodies
+import json
+
+try:
+    import orjson
+except ImportError:  # optional, faster
+    orjson = None
+
+
+class JSONCodec:
+    """
+    Encodes the JSON payloads :class:`.Session` sends and decodes the bodies of its responses, using the standard
+    library. Subclass it and override :meth:`loads` and :meth:`dumps` to use another JSON library.
+    """
+
+    def loads(self, data):
+        """
+        Decodes a response body from bytes.
+        """
+
+        return json.loads(data)
+
+    def dumps(self, obj):
+        """
+        Encodes a request payload to bytes.
+        """
+
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    :class:`JSONCodec` using :mod:`orjson`, which decodes straight from bytes several times faster.
+    """
+
+    def __init__(self):
+        if orjson is None:
+            raise RuntimeError("OrjsonCodec requires orjson, install it with pip install orjson")
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+    def dumps(self, obj):
+        return orjson.dumps(obj)
+
+
+def default_codec():
+    """
+    Returns an :class:`OrjsonCodec` if orjson is installed, otherwise a :class:`JSONCodec`.
+    """
+
+    return OrjsonCodec() if orjson is not None else JSONCodec()
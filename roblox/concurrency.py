@@ -0,0 +1,149 @@
+# Adaptive per-host concurrency limits
+import asyncio
+import logging
+import time
+from collections import deque
+
+log = logging.getLogger(__name__)
+
+
+class _HostLimit:
+    __slots__ = ("limit", "inflight", "waiters", "latency", "last_decrease")
+
+    def __init__(self, limit):
+        self.limit = float(limit)
+        self.inflight = 0
+        self.waiters = deque()
+        self.latency = None  # smoothed latency of successful requests
+        self.last_decrease = 0.0
+
+
+class AIMDLimiter:
+    """
+    Limits the number of requests in flight to each host, finding the highest sustainable level with additive
+    increase / multiplicative decrease.
+
+    Every successful request sent while the host was at its limit raises the limit by ``increase / limit``, so the
+    limit grows by about ``increase`` per round trip. A 429, a 5xx, a connection error or a response slower than
+    ``latency_tolerance`` times the host's usual latency multiplies the limit by ``decrease``, at most once per
+    round trip. A request counts as in flight until its response headers arrive.
+
+    Args:
+        initial: Starting limit for each host.
+        min_limit: Lowest the limit can go.
+        max_limit: Highest the limit can go.
+        increase: Additive increase per round trip.
+        decrease: Multiplicative decrease factor.
+        latency_tolerance: How many times slower than usual a response may be before the limit is decreased.
+        cooldown: Min number of seconds between two decreases on the same host, used when it's longer than the
+                  host's usual latency.
+
+    Attributes:
+        decisions: The most recent ``(time, host, action, limit, reason)`` decisions, newest last.
+    """
+
+    def __init__(self, initial=8, min_limit=1, max_limit=256, increase=1.0, decrease=0.5, latency_tolerance=2.0,
+                 cooldown=0.05, history=100):
+        self.initial = initial
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_tolerance = latency_tolerance
+        self.cooldown = cooldown
+
+        self.decisions = deque(maxlen=history)
+        self._hosts = {}
+
+    def _host(self, host):
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = _HostLimit(self.initial)
+
+        return state
+
+    def limits(self):
+        """
+        Returns ``{host: {"limit": ..., "inflight": ..., "waiting": ..., "latency": ...}}`` for every host seen.
+        """
+
+        return {host: {
+            "limit": int(state.limit),
+            "inflight": state.inflight,
+            "waiting": len(state.waiters),
+            "latency": state.latency
+        } for host, state in self._hosts.items()}
+
+    async def acquire(self, host):
+        """|coro|
+
+        Waits until another request to ``host`` may be sent.
+        """
+
+        state = self._host(host)
+
+        if state.inflight < int(state.limit) and not state.waiters:
+            state.inflight += 1
+            return
+
+        fut = asyncio.get_running_loop().create_future()
+        state.waiters.append(fut)
+
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # was handed a slot just before being cancelled
+                self.release(host)
+            else:
+                state.waiters.remove(fut)
+            raise
+
+    def release(self, host, latency=None, status=None, error=False):
+        """
+        Frees a slot for ``host`` and adjusts its limit from the outcome of the request: its ``latency`` and
+        response ``status``, or ``error`` if it failed without a response. Releasing without an outcome (e.g. when
+        cancelled) doesn't change the limit.
+        """
+
+        state = self._host(host)
+        saturated = state.inflight >= int(state.limit)
+        state.inflight -= 1
+
+        if error or status == 429 or (status is not None and status >= 500):
+            self._decrease(host, state, "error" if error else str(status))
+        elif latency is not None:
+            if state.latency is not None and latency > state.latency * self.latency_tolerance:
+                self._decrease(host, state, "latency {:.2f}s".format(latency))
+            else:
+                state.latency = latency if state.latency is None else state.latency * 0.9 + latency * 0.1
+
+                if saturated and state.limit < self.max_limit:
+                    previous = int(state.limit)
+                    state.limit = min(self.max_limit, state.limit + self.increase / state.limit)
+
+                    if int(state.limit) > previous:
+                        self._decide(host, state, "increase", "saturated")
+
+        self._wake(state)
+
+    def _decrease(self, host, state, reason):
+        now = time.monotonic()
+        if now - state.last_decrease < max(self.cooldown, state.latency or 0):
+            return
+
+        state.last_decrease = now
+        state.limit = max(self.min_limit, state.limit * self.decrease)
+        self._decide(host, state, "decrease", reason)
+
+    def _decide(self, host, state, action, reason):
+        self.decisions.append((time.time(), host, action, int(state.limit), reason))
+        log.debug("{} concurrency for {} to {} ({})".format(action, host, int(state.limit), reason))
+
+    def _wake(self, state):
+        # hands free slots straight to waiters
+        while state.waiters and state.inflight < int(state.limit):
+            fut = state.waiters.popleft()
+            if not fut.done():
+                state.inflight += 1
+                fut.set_result(None)
@@ -0,0 +1,68 @@
+# Deadlines shared by every request made within a call
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+
+from roblox.errors import DeadlineExceeded
+
+_deadline = ContextVar("roblox_deadline", default=None)
+
+
+@contextmanager
+def deadline(seconds):
+    """
+    Context manager giving every request made inside it one shared time budget. Requests still running when it
+    runs out are cancelled with :class:`.DeadlineExceeded`. Nested deadlines can only shorten the budget.
+    """
+
+    at = time.monotonic() + seconds
+
+    current = _deadline.get()
+    if current is not None:
+        at = min(at, current)
+
+    token = _deadline.set(at)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def without_deadline():
+    """
+    Returns a copy of the current context without its deadline, for work shared with callers that have their own
+    deadlines. Everything else, like the scheduling tag, carries over.
+    """
+
+    ctx = copy_context()
+    ctx.run(_deadline.set, None)
+    return ctx
+
+
+def remaining():
+    # seconds left before the current deadline, None if there isn't one
+
+    at = _deadline.get()
+    if at is None:
+        return None
+
+    return at - time.monotonic()
+
+
+async def within_deadline(coro):
+    left = remaining()
+    if left is None:
+        return await coro
+
+    if left <= 0:
+        if asyncio.iscoroutine(coro):
+            coro.close()
+        raise DeadlineExceeded("Deadline exceeded before the request was sent")
+
+    try:
+        return await asyncio.wait_for(coro, left)
+    except asyncio.TimeoutError:
+        if remaining() > 0:  # timed out on its own
+            raise
+        raise DeadlineExceeded("Deadline exceeded after {:.3f}s".format(left)) from None
@@ -0,0 +1,291 @@
+# Declarative registry of the API endpoints Session calls
+import re
+
+from yarl import URL
+
+from roblox.errors import *
+
+
+# base URLs
+class Url:
+    Roblox = "https://www.roblox.com"
+    Api = "https://api.roblox.com"
+    Auth = "https://auth.roblox.com/v2"
+    Users = "https://users.roblox.com/v1"
+    Friends = "https://friends.roblox.com/v1"
+    Premium = "https://premiumfeatures.roblox.com/v1"
+    Inventory = "https://inventory.roblox.com/v2"
+    Catalog = "https://catalog.roblox.com/v1"
+    Game1 = "https://games.roblox.com/v1"
+    Game2 = "https://games.roblox.com/v2"
+    Economy = "https://economy.roblox.com/v1"
+    Economy2 = "https://economy.roblox.com/v2"
+    AssetDelivery = "https://assetdelivery.roblox.com/v1"
+    Group1 = "https://groups.roblox.com/v1"
+    Group2 = "https://groups.roblox.com/v2"
+    Thumbnails = "https://thumbnails.roblox.com/v1"
+    Presence = "https://presence.roblox.com/v1"
+
+
+placeholder = re.compile(r"{(\w+)}")
+
+
+class Endpoint:
+    """
+    Describes one API endpoint: where it is, how it may be called and what its errors mean.
+
+    Args:
+        name: Stable name used for stats and policies, e.g. ``"users.get"``.
+        method: HTTP method.
+        url: URL template, with ``{placeholders}`` filled in from the call's keyword arguments.
+        idempotent: Whether a failed call may be retried. Defaults to ``True`` for GET, PUT, DELETE, HEAD and
+                    OPTIONS.
+        paged: Pagination style, ``"cursor"`` for pages linked by ``nextPageCursor``, or ``None``.
+        batch: ``(param, size)`` if the endpoint takes up to ``size`` ids at once, as comma separated ids in query
+               parameter ``param`` or as a list in JSON payload key ``param``.
+        errors: Mapping of failure to ``(exception, message)``. Keys are a status, a ``(status, code)`` pair, a
+                ``(None, code)`` pair matching the first error code in the body at any status, or ``None`` for any
+                other failure. Messages are formatted with the call's keyword arguments.
+        cache: Whether responses may be served from the response cache. ``False`` for data that changes with the
+               client's own actions.
+        ttl: Cache TTL in seconds for this endpoint, overriding the cache's default.
+        retries: Max number of retries for this endpoint, overriding the retry policy's default.
+        pinned: Whether the response depends on the signed in account, so reads are always sent by the primary
+                account instead of being spread over the account pool.
+    """
+
+    __slots__ = ("name", "method", "template", "idempotent", "paged", "batch", "errors", "cache", "ttl", "retries",
+                 "pinned")
+
+    def __init__(self, name, method, url, idempotent=None, paged=None, batch=None, errors=None, cache=True,
+                 ttl=None, retries=None, pinned=False):
+        self.name = name
+        self.method = method.upper()
+        self.template = url
+        self.idempotent = self.method in ("GET", "PUT", "DELETE", "HEAD", "OPTIONS") if idempotent is None \
+            else idempotent
+        self.paged = paged
+        self.batch = batch
+        self.errors = dict(errors or {})
+        self.cache = cache
+        self.ttl = ttl
+        self.retries = retries
+        self.pinned = pinned
+
+    def __repr__(self):
+        return "Endpoint({!r}, {} {})".format(self.name, self.method, self.template)
+
+    def url(self, **kwargs):
+        return self.template.format(**kwargs)
+
+    @property
+    def pattern(self):
+        # host and path with every placeholder as a wildcard, for the URL pattern based policies
+        url = URL(placeholder.sub("0", self.template))
+        path = placeholder.sub("*", self.template.split(url.host, 1)[1])
+
+        return "{}{}".format(url.host, path)
+
+    def error(self, status, body=None, **kwargs):
+        """
+        Returns the exception for a failed call, or ``None`` if the failure isn't mapped.
+        """
+
+        code = None
+        if isinstance(body, dict) and body.get("errors"):
+            code = body["errors"][0].get("code")
+
+        for key in ((status, code), (None, code), status, None):
+            if key in self.errors:
+                exc, message = self.errors[key]
+                return exc(message.format(status=status, code=code, **kwargs)) if message else exc()
+
+        return None
+
+
+# every endpoint by name, Session.call looks them up here
+ENDPOINTS = {}
+
+
+def endpoint(name, method, url, **options):
+    """
+    Registers an :class:`Endpoint` in :data:`ENDPOINTS`.
+    """
+
+    ENDPOINTS[name] = Endpoint(name, method, url, **options)
+    return ENDPOINTS[name]
+
+
+# users
+
+endpoint("users.authenticated", "get", Url.Users + "/users/authenticated", cache=False, pinned=True)
+endpoint("users.by_usernames", "post", Url.Users + "/usernames/users", idempotent=True, batch=("usernames", 100))
+endpoint("users.by_ids", "post", Url.Users + "/users", idempotent=True, batch=("userIds", 100))
+endpoint("users.get", "get", Url.Users + "/users/{user_id}", errors={
+    None: (UserIdentificationError, "User {user_id!r} not found")
+})
+endpoint("users.status", "get", Url.Users + "/users/{user_id}/status", cache=False, errors={
+    None: (UserIdentificationError, "User {user_id!r} not found")
+})
+endpoint("users.set_status", "patch", Url.Users + "/users/{user_id}/status", errors={
+    403: (AuthError, "Not authorized to update status"),
+    None: (UserError, None)
+})
+endpoint("users.premium", "get", Url.Premium + "/users/{user_id}/validate-membership", errors={
+    None: (AuthError, None)
+})
+endpoint("users.roles", "get", Url.Group1 + "/users/{user_id}/groups/roles", errors={
+    None: (UserError, None)
+})
+endpoint("users.presence", "post", Url.Presence + "/presence/users", idempotent=True, batch=("userIds", 50))
+endpoint("users.settings", "get", Url.Roblox + "/my/settings/json", cache=False, pinned=True, errors={
+    None: (AuthError, None)
+})
+
+# friends
+
+endpoint("friends.list", "get", Url.Friends + "/users/{user_id}/friends", errors={
+    404: (UserIdentificationError, "User {user_id!r} not found")
+})
+endpoint("friends.statuses", "get", Url.Friends + "/users/{user_id}/friends/statuses", cache=False,
+         batch=("userIds", 100), errors={
+             (None, 1): (UserIdentificationError, "Target user is invalid or does not exist"),
+             None: (UserError, None)
+         })
+endpoint("friends.unfriend", "post", Url.Friends + "/users/{user_id}/unfriend", errors={
+    400: (UserIdentificationError, None),
+    None: (UserError, None)
+})
+endpoint("friends.requests", "get", Url.Friends + "/my/friends/requests", paged="cursor", pinned=True)
+endpoint("friends.request_count", "get", Url.Friends + "/user/friend-requests/count", cache=False, pinned=True,
+         errors={None: (AuthError, None)})
+endpoint("friends.decline_all", "post", Url.Friends + "/user/friend-requests/decline-all", errors={
+    None: (AuthError, "Couldn't decline friend requests ({status})")
+})
+endpoint("friends.accept", "post", Url.Friends + "/users/{user_id}/accept-friend-request", errors={
+    (None, 1): (UserIdentificationError, "User {user_id!r} not found"),
+    (None, 10): (UserError, "Friend request does not exist"),
+    (None, 11): (FriendLimitExceeded, "Friend limit exceeded"),
+    (None, 12): (FriendLimitExceeded, "Friend limit exceeded"),
+    None: (UserError, None)
+})
+endpoint("friends.decline", "post", Url.Friends + "/users/{user_id}/decline-friend-request", errors={
+    (None, 1): (UserIdentificationError, "User {user_id!r} not found"),
+    (None, 10): (UserError, "Friend request does not exist"),
+    None: (UserError, None)
+})
+endpoint("friends.request", "post", Url.Friends + "/users/{user_id}/request-friendship", errors={
+    (None, 1): (UserIdentificationError, None),
+    (None, 5): (UserError, "Already friends with {user_id!r}"),
+    (None, 7): (UserError, "Can't send friend request to self"),
+    (None, 10): (UserIdentificationError, "User {user_id!r} doesn't exist"),
+    None: (UserError, "{code}")
+})
+endpoint("friends.follow", "post", Url.Friends + "/users/{user_id}/follow", errors={
+    400: (UserIdentificationError, None),
+    None: (UserError, None)
+})
+endpoint("friends.unfollow", "post", Url.Friends + "/users/{user_id}/unfollow", errors={
+    400: (UserIdentificationError, None),
+    None: (UserError, None)
+})
+endpoint("friends.followers", "get", Url.Friends + "/users/{user_id}/followers", paged="cursor")
+endpoint("friends.followers_count", "get", Url.Friends + "/users/{user_id}/followers/count", errors={
+    400: (UserIdentificationError, None),
+    None: (UserError, None)
+})
+endpoint("friends.followings", "get", Url.Friends + "/users/{user_id}/followings", paged="cursor")
+endpoint("friends.followings_count", "get", Url.Friends + "/users/{user_id}/followings/count", errors={
+    400: (UserIdentificationError, None),
+    None: (UserError, None)
+})
+
+# assets and economy
+
+endpoint("inventory.by_type", "get", Url.Inventory + "/users/{user_id}/inventory/{asset_type}", paged="cursor")
+endpoint("inventory.has_asset", "get", Url.Api + "/ownership/hasasset", cache=False, errors={
+    None: (UserError, None)
+})
+endpoint("inventory.delete", "post", Url.Roblox + "/asset/delete-from-inventory", errors={
+    None: (AssetError, None)
+})
+endpoint("assets.product_info", "get", Url.Api + "/marketplace/productinfo", errors={
+    None: (AssetNotFound, None)
+})
+endpoint("catalog.details", "post", Url.Catalog + "/catalog/items/details", idempotent=True, batch=("items", 120))
+endpoint("assets.download", "get", Url.AssetDelivery + "/asset/", pinned=True, errors={
+    409: (AuthError, "Not authorized to download asset")
+})
+endpoint("assets.upload", "post", Url.Roblox + "/build/upload")
+endpoint("economy.currency", "get", Url.Economy + "/users/{user_id}/currency", cache=False, pinned=True, errors={
+    None: (AuthError, None)
+})
+endpoint("economy.purchase", "post", Url.Economy + "/purchases/products/{product_id}")
+
+# favorites
+
+endpoint("favorites.count", "get", Url.Catalog + "/favorites/assets/{asset_id}/count", errors={
+    None: (AssetNotFound, None)
+})
+endpoint("favorites.get", "get", Url.Catalog + "/favorites/users/{user_id}/assets/{asset_id}/favorite",
+         cache=False, pinned=True)
+endpoint("favorites.delete", "delete", Url.Catalog + "/favorites/users/{user_id}/assets/{asset_id}/favorite",
+         errors={
+             400: (AssetNotFound, None),
+             (403, 0): (AuthError, None),
+             (403, 6): (AuthError, None),
+             (403, 7): (Captcha, None),
+             409: (AssetError, "Asset already not favorited")
+         })
+endpoint("favorites.create", "post", Url.Catalog + "/favorites/users/{user_id}/assets/{asset_id}/favorite",
+         errors={
+             400: (AssetNotFound, None),
+             (403, 0): (AuthError, None),
+             (403, 6): (AuthError, None),
+             (403, 7): (Captcha, None),
+             409: (AssetError, "Asset already favorited")
+         })
+
+# games
+
+game_errors = {
+    400: (GameNotFound, "Invalid Root Place"),
+    401: (AuthError, None)
+}
+
+endpoint("games.favorited", "get", Url.Game1 + "/games/{universe_id}/favorites", cache=False, pinned=True,
+         errors=game_errors)
+endpoint("games.favorites_count", "get", Url.Game1 + "/games/{universe_id}/favorites/count", errors=game_errors)
+endpoint("games.favorite", "post", Url.Game1 + "/games/{universe_id}/favorites", errors={
+    400: (GameNotFound, "Invalid Root Place"),
+    401: (AuthError, None),
+    None: (UserError, "Couldn't favorite universe {universe_id} ({status})")
+})
+endpoint("games.place_details", "get", Url.Game1 + "/games/multiget-place-details", batch=("placeIds", 50),
+         errors={None: (GameNotFound, None)})
+endpoint("games.details", "get", Url.Game1 + "/games", batch=("universeIds", 50), errors={
+    None: (GameNotFound, None)
+})
+endpoint("games.by_user", "get", Url.Game2 + "/users/{user_id}/games", paged="cursor")
+
+# groups
+
+endpoint("groups.get", "get", Url.Group1 + "/groups/{group_id}", errors={
+    None: (GroupNotFound, "Couldn't find group {group_id!r}")
+})
+endpoint("groups.multi", "get", Url.Group2 + "/groups", batch=("groupIds", 100))
+endpoint("groups.roles", "get", Url.Group1 + "/groups/{group_id}/roles", errors={
+    None: (GroupNotFound, "Couldn't find group {group_id!r}")
+})
+endpoint("groups.members", "get", Url.Group1 + "/groups/{group_id}/users", paged="cursor")
+endpoint("groups.role_details", "get", Url.Group1 + "/roles", batch=("ids", 100), errors={
+    None: (RoleNotFound, None)
+})
+
+# thumbnails, never served from the response cache so pending ones can be polled
+
+endpoint("thumbnails.avatar", "get", Url.Thumbnails + "/users/avatar", cache=False, batch=("userIds", 100))
+endpoint("thumbnails.headshot", "get", Url.Thumbnails + "/users/avatar-headshot", cache=False,
+         batch=("userIds", 100))
+endpoint("thumbnails.assets", "get", Url.Thumbnails + "/assets", cache=False, batch=("assetIds", 100))
+endpoint("thumbnails.game_icons", "get", Url.Thumbnails + "/games/icons", cache=False, batch=("universeIds", 100))
@@ -54,3 +54,15 @@ class AssetType(IntEnum):
     PoseAnimation = 56
     EarAccessory = 57
     Video = 62
+
+
+class PresenceType(IntEnum):
+    """
+    Where a user is online, see :class:`.Presence`.
+    """
+
+    Offline = 0
+    Online = 1
+    InGame = 2
+    InStudio = 3
+    Invisible = 4
@@ -6,6 +6,18 @@ class RateLimit(RobloxException):
     pass
 
 
+class OfflineError(RobloxException):
+    pass
+
+
+class DeadlineExceeded(RobloxException):
+    pass
+
+
+class CircuitOpen(RobloxException):
+    pass
+
+
 # AUTH ERRORS
 
 class AuthError(RobloxException):
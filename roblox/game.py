@@ -32,8 +32,17 @@ class Place(Asset):
     def __repr__(self):
         return "Place({!r})".format(self._data["name"] or self._data["id"])
 
+    async def _get_catalog_details(self, nocache=False, field=None):
+        # places aren't sold in the catalog
+        await self._get_product_info(nocache)
+
     async def _get_place_details(self):
-        details = (await self._state.get_place_details(await self.id))[0]
+        place_id = await self.id
+
+        async def fetch():
+            return dict(await self._state.load_place_details(place_id))
+
+        details = await self._state.stored("place", place_id, fetch)
         self._update(details)
 
     @async_property
@@ -61,7 +70,7 @@ def g_info(name, nocache=False):
     def decorator(fn):
         async def new_fn(self):
             if nocache or self._data[name] is None:
-                await self._get_game_details()
+                await self._get_game_details(nocache)
 
             return self._data[name]
 
@@ -109,8 +118,13 @@ class Universe(_BaseUniverse):
 
         self._data.update(data)
 
-    async def _get_game_details(self):
-        details = (await self._state.get_game_details(await self.id))["data"][0]
+    async def _get_game_details(self, nocache=False):
+        universe_id = await self.id
+
+        async def fetch():
+            return dict(await self._state.load_game_details(universe_id))
+
+        details = await self._state.stored("universe", universe_id, fetch, nocache)
         self._update(details)
 
     @async_property
@@ -199,3 +213,17 @@ class Universe(_BaseUniverse):
     async def favorites(self) -> int:
         data = await self._state.universe_favorites(await self.id)
         return data.get("favoritesCount")
+
+    async def thumbnail(self, size="512x512", format="Png"):
+        """|coro|
+
+        URL of the game's icon, or ``None`` if it isn't available.
+
+        Args:
+            size: Image size, e.g. ``"512x512"``.
+            format: ``"Png"`` or ``"Jpeg"``.
+
+        :rtype: str
+        """
+
+        return await self._state.get_thumbnail("thumbnails.game_icons", await self.id, size, format)
@@ -22,15 +22,18 @@ log = logging.getLogger(__name__)
 
 
 # util decorator
-def g_info(name, nocache=False):
+def g_info(name, nocache=False, summary=False):
     """This decorator will check if the property is in the group"s _data, and if it isn"t send a request to the
-    groups API endpoint"""
+    groups API endpoint. Summary fields are loaded in bulk with other groups"""
 
     def decorator(fn):
         @wraps(fn)
         async def new_fn(self):
+            if summary and not nocache and self._data[name] is None:
+                await self._get_group_summary()
+
             if nocache or self._data[name] is None:
-                await self._get_group_details()
+                await self._get_group_details(nocache)
 
             return self._data[name]
 
@@ -72,10 +75,16 @@ class Group(_Group):
     def _update(self, data):
         self._data.update(data)
 
-    async def _get_group_details(self):
-        data = await self._state.get_group_details(await self.id)
+    async def _get_group_details(self, nocache=False):
+        group_id = self._data["id"]
+        data = await self._state.stored("group", group_id, lambda: self._state.get_group_details(group_id), nocache)
         self._update(data)
 
+    async def _get_group_summary(self):
+        # the bulk endpoint has a different owner format, so only its name and description are used
+        data = await self._state.load_group_summary(self._data["id"])
+        self._update({"name": data["name"], "description": data["description"]})
+
     @async_property
     @g_info("id")
     async def id(self):
@@ -88,7 +97,7 @@ class Group(_Group):
         pass
 
     @async_property
-    @g_info("name")
+    @g_info("name", summary=True)
     async def name(self):
         """|asyncprop|
 
@@ -99,7 +108,7 @@ class Group(_Group):
         pass
 
     @async_property
-    @g_info("description")
+    @g_info("description", summary=True)
     async def description(self):
         """|asyncprop|
 
@@ -189,7 +198,8 @@ class Group(_Group):
         :rtype: List[:class:`.Role`]
         """
 
-        data = await self._state.get_group_roles(await self.id)
+        group_id = await self.id
+        data = await self._state.stored("roles", group_id, lambda: self._state.get_group_roles(group_id))
         roles = []
         for role in data["roles"]:
             roles.append(
@@ -572,8 +582,12 @@ class Role(_Role):
         self._data.update(data)
 
     async def _get_role_details(self):
-        data = await self._state.get_role_details(await self.id)
-        data = data["data"][0]
+        role_id = await self.id
+
+        async def fetch():
+            return dict(await self._state.load_role_details(role_id))
+
+        data = await self._state.stored("role", role_id, fetch)
         self._update(data)
 
     @async_property
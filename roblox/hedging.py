@@ -0,0 +1,105 @@
+# Hedged requests for tail latency
+import asyncio
+import logging
+from collections import deque
+
+log = logging.getLogger(__name__)
+
+
+class Hedger:
+    """
+    Sends a second copy of an idempotent GET when the first hasn't answered within a percentile of the host's
+    recent latencies, and uses whichever response arrives first.
+
+    Args:
+        percentile: Latency percentile after which a request is hedged.
+        min_samples: Number of latencies a host needs before its requests are hedged.
+        window: Number of recent latencies kept per host.
+        min_delay: Never hedge sooner than this many seconds.
+        max_ratio: Max share of requests that may be hedged, so hedging can't double the load on a slow host.
+
+    Attributes:
+        stats: Number of ``requests``, requests ``hedged`` and hedges that ``won``.
+    """
+
+    def __init__(self, percentile=95, min_samples=20, window=200, min_delay=0.05, max_ratio=0.1):
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.window = window
+        self.min_delay = min_delay
+        self.max_ratio = max_ratio
+
+        self._latencies = {}
+
+        self.stats = {
+            "requests": 0,
+            "hedged": 0,
+            "won": 0
+        }
+
+    def record(self, host, latency):
+        samples = self._latencies.get(host)
+        if samples is None:
+            samples = self._latencies[host] = deque(maxlen=self.window)
+
+        samples.append(latency)
+
+    def delay(self, host):
+        """
+        Returns how long to wait for a response from ``host`` before hedging, or ``None`` not to hedge.
+        """
+
+        samples = self._latencies.get(host)
+        if samples is None or len(samples) < self.min_samples:
+            return None
+
+        if self.stats["hedged"] >= self.max_ratio * self.stats["requests"]:
+            return None
+
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(len(ordered) * self.percentile / 100))
+
+        return max(self.min_delay, ordered[index])
+
+    async def run(self, host, factory):
+        """|coro|
+
+        Awaits ``factory()``, starting a second ``factory()`` if the first is slow, and returns the first result.
+        The loser is cancelled.
+        """
+
+        loop = asyncio.get_running_loop()
+        self.stats["requests"] += 1
+
+        started = loop.time()
+        first = asyncio.ensure_future(factory())
+        tasks = {first}
+
+        try:
+            delay = self.delay(host)
+            if delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+
+                if not done:
+                    log.debug("hedging request to {} after {:.3f}s".format(host, delay))
+                    self.stats["hedged"] += 1
+                    tasks.add(asyncio.ensure_future(factory()))
+
+            error = None
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    if task.exception() is None:
+                        if task is not first:
+                            self.stats["won"] += 1
+
+                        self.record(host, loop.time() - started)
+                        return task.result()
+
+                    error = task.exception()
+
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
@@ -1,65 +1,303 @@
 # This module handles all API calls
 import asyncio
+from http.cookies import SimpleCookie
+import json
 import logging
 import re
+import time
 
 import aiohttp
 from aiohttp import FormData
 import chardet
-
+from yarl import URL
+
+from roblox.accounts import AccountPool
+from roblox.batching import Batcher
+from roblox.cache import ResponseCache
+from roblox.circuit import CircuitBreaker
+from roblox.codec import default_codec
+from roblox.coalesce import Coalescer, request_key
+from roblox.concurrency import AIMDLimiter
+from roblox.deadline import remaining as deadline_remaining, within_deadline, without_deadline
+from roblox.endpoints import ENDPOINTS, Url
 from roblox.errors import *
+from roblox.hedging import Hedger
+from roblox.proxies import ProxyPool
+from roblox.ratelimit import RateLimiter
+from roblox.retry import RetryPolicy, RETRY_EXCEPTIONS
+from roblox.scheduler import Scheduler, current as current_schedule
+from roblox.thumbnails import ThumbnailCache, POLL_ATTEMPTS, POLL_INTERVAL
+from roblox.transport import AiohttpTransport, USER_AGENT
 
 log = logging.getLogger(__name__)
 
-USER_AGENT = "Mozilla/5.0 (Windows NT 6.1; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/60.0.3112.90 Saf" \
-             "ari/537.36"
-
 # util
 xsrf = re.compile(r"setToken\('(.{4,16})'\);")
 url = re.compile("<url>(.+)</url>")
 rvt = re.compile(r'<input name="?__RequestVerificationToken"?[ \w=]+value="?(\S+)"?>')
 
 
-# base URLs
-class Url:
-    Roblox = "https://www.roblox.com"
-    Api = "https://api.roblox.com"
-    Auth = "https://auth.roblox.com/v2"
-    Users = "https://users.roblox.com/v1"
-    Friends = "https://friends.roblox.com/v1"
-    Premium = "https://premiumfeatures.roblox.com/v1"
-    Inventory = "https://inventory.roblox.com/v2"
-    Catalog = "https://catalog.roblox.com/v1"
-    Game1 = "https://games.roblox.com/v1"
-    Game2 = "https://games.roblox.com/v2"
-    Economy = "https://economy.roblox.com/v1"
-    Economy2 = "https://economy.roblox.com/v2"
-    AssetDelivery = "https://assetdelivery.roblox.com/v1"
-    Group1 = "https://groups.roblox.com/v1"
-    Group2 = "https://groups.roblox.com/v2"
-
-
 def ok(resp):
     # True if response is OK
     return 200 <= (resp if isinstance(resp, int) else resp.status) < 300
 
 
+def make_connector(limit=100, limit_per_host=0, keepalive_timeout=30.0, dns_cache_ttl=300, resolver=None):
+    """
+    Creates a connection pool that can be shared between several clients, e.g. ``Roblox(connector=conn)``, so they
+    reuse warm connections to the same hosts. Shared connectors aren't closed with the clients using them.
+
+    Args:
+        limit: Max number of open connections in total. ``0`` means no limit.
+        limit_per_host: Max number of open connections to a single host. ``0`` means no limit.
+        keepalive_timeout: Seconds an idle connection is kept open for reuse.
+        dns_cache_ttl: Seconds DNS lookups are cached for. ``None`` caches forever.
+        resolver: aiohttp resolver to use, or ``True`` for :class:`aiohttp.AsyncResolver` (requires aiodns).
+    """
+
+    if resolver is True:
+        resolver = aiohttp.AsyncResolver()
+
+    return aiohttp.TCPConnector(limit=limit, limit_per_host=limit_per_host, keepalive_timeout=keepalive_timeout,
+                                ttl_dns_cache=dns_cache_ttl, use_dns_cache=True, resolver=resolver)
+
+
+def api_hosts():
+    # every host in Url, in order
+    hosts = [URL(base).host for name, base in vars(Url).items() if not name.startswith("_")]
+    return list(dict.fromkeys(hosts))
+
+
+def merge_pages(pages):
+    # joins the responses of a batch call split over several requests
+    if all(isinstance(page, list) for page in pages):
+        return [item for page in pages for item in page]
+
+    merged = dict(pages[0])
+    merged["data"] = [item for page in pages for item in page.get("data", [])]
+    return merged
+
+
+def replayable(kwargs):
+    # multipart bodies can only be sent once
+    return not isinstance(kwargs.get("data"), FormData)
+
+
+class Response:
+    """
+    A response whose body has already been read, so it can be handed to several callers and read after its
+    connection was released. Mirrors the parts of :class:`aiohttp.ClientResponse` the endpoint methods use. Every
+    response from :meth:`.Session.req` is one of these, with its JSON decoded by the session's codec.
+
+    The decoded JSON is shared between everyone holding the response and shouldn't be modified destructively.
+    """
+
+    __slots__ = ("method", "url", "status", "reason", "headers", "charset", "body", "_loads", "_json")
+
+    def __init__(self, *, method, url, status, reason=None, headers=None, charset=None, body=b"", loads=json.loads):
+        self.method = method
+        self.url = url
+        self.status = status
+        self.reason = reason
+        self.headers = headers or {}
+        self.charset = charset
+        self.body = body
+
+        self._loads = loads
+        self._json = None
+
+    def __repr__(self):
+        return "<Response [{} {}] {}>".format(self.status, self.reason, self.url)
+
+    @classmethod
+    async def read_from(cls, resp, loads=json.loads):
+        # buffers a transport's response and releases its connection, the body is decoded by `loads` when needed
+
+        try:
+            body = await resp.read()
+        finally:
+            resp.release()
+
+        return cls(method=resp.method, url=resp.url, status=resp.status, reason=resp.reason,
+                   headers=resp.headers, charset=resp.charset, body=body, loads=loads)
+
+    def release(self):
+        pass
+
+    async def read(self):
+        return self.body
+
+    async def text(self, encoding=None):
+        return self.body.decode(encoding or self.charset or "utf-8")
+
+    async def json(self):
+        if self._json is None and self.body.strip():
+            self._json = self._loads(self.body)
+
+        return self._json
+
+
+class _RequestContext:
+    # lets Session.req be used with `async with` or `await` like aiohttp's own request method
+
+    __slots__ = ("_coro", "_resp")
+
+    def __init__(self, coro):
+        self._coro = coro
+        self._resp = None
+
+    def __await__(self):
+        return self._coro.__await__()
+
+    async def __aenter__(self):
+        self._resp = await self._coro
+        return self._resp
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._resp.release()
+
+
 class Session:
-    def __init__(self, username=None, password=None):
+    def __init__(self, username=None, password=None, rate_limiter=None, retry_policy=None, coalesce=True,
+                 cache=None, store=None, concurrency=None, scheduler=None, hedger=None, breaker=None,
+                 accounts=None, proxies=None, transport=None, codec=None, batch_window=0.01, thumbnail_cache=True,
+                 connector=None, **connector_options):
         self.username = username
         self.password = password
 
         self.client = None
 
         self.token = None
-
-        self.session = aiohttp.ClientSession(headers={
-            "User-Agent": USER_AGENT
-        })
+        self.unverified = False  # restored from exported state, not checked yet
+        self._verifying = None
+
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.coalescer = Coalescer() if coalesce else None
+        self.cache = ResponseCache() if cache is True else cache
+        self.store = store
+        self.concurrency = AIMDLimiter() if concurrency is True else concurrency
+        self.scheduler = Scheduler() if scheduler is True else scheduler
+        self.hedger = Hedger() if hedger is True else hedger
+        self.breaker = CircuitBreaker() if breaker is True else breaker
+        self.proxies = ProxyPool(proxies) if isinstance(proxies, (list, tuple)) else proxies
+        self.codec = codec or default_codec()
+
+        # lookups made within batch_window seconds are sent together to the bulk endpoints
+        self.batch_window = batch_window
+        self.loaders = {}
+        self.thumbnail_cache = ThumbnailCache() if thumbnail_cache is True else thumbnail_cache
+
+        # a connector passed in is shared with other sessions and isn't ours to close
+        self.connector = None
+        if transport is None:
+            self.connector = connector or make_connector(**connector_options)
+            transport = AiohttpTransport(self.connector, owner=connector is None)
+
+        self.session = transport
+
+        # reads can be spread over extra accounts, writes always use this session
+        self.accounts = accounts or AccountPool()
+        self.accounts.add("primary", self.session, primary=True)
+
+        self._rewarm = None
+
+        # calls, errors and total time per endpoint name
+        self.endpoint_stats = {}
+        self.apply_endpoint_policies()
 
     async def close(self):
+        if self._rewarm is not None:
+            self._rewarm.cancel()
+
+        for account in self.accounts.accounts:
+            if not account.primary:
+                await account.session.close()
+
         await self.session.close()
 
+        if self.store is not None:
+            self.store.close()
+
+    async def warmup(self, hosts=None, connections=1, every=None, timeout=10.0):
+        """
+        Opens ``connections`` pooled connections to each host at once, so the first real requests skip DNS, TCP and
+        TLS setup. Returns ``{host: seconds}``, or ``{host: exception}`` for hosts that couldn't be reached.
+
+        With a :class:`.ProxyPool` the connections are opened through each healthy proxy instead.
+
+        If ``every`` is given, the hosts are warmed up again every ``every`` seconds until the session is closed;
+        keep it below the connector's ``keepalive_timeout`` so idle connections are replaced before they're dropped.
+        """
+
+        hosts = [URL(host).host if "://" in host else host for host in hosts or api_hosts()]
+
+        # requests go out through the proxies, so their connections are the ones worth opening
+        proxies = [None] if self.proxies is None else self.proxies.healthy() or self.proxies.proxies
+
+        async def connect(host, proxy):
+            kwargs = {}
+            if proxy is not None:
+                await proxy.acquire()
+                kwargs["proxy"] = proxy.url
+
+            started = time.monotonic()
+
+            try:
+                resp = await self.session.request("HEAD", "https://{}/".format(host), allow_redirects=False,
+                                                  timeout=timeout, **kwargs)
+                resp.release()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                return e
+            finally:
+                if proxy is not None:
+                    proxy.release()
+
+            return time.monotonic() - started
+
+        async def warm(host):
+            results = await asyncio.gather(*(connect(host, proxy) for proxy in proxies for _ in range(connections)))
+            timings = [r for r in results if not isinstance(r, Exception)]
+
+            return host, max(timings) if timings else results[0]
+
+        timings = dict(await asyncio.gather(*(warm(host) for host in hosts)))
+
+        for host, timing in timings.items():
+            if isinstance(timing, Exception):
+                log.warning("couldn't warm up {}: {!r}".format(host, timing))
+            else:
+                log.debug("warmed up {} in {:.3f}s".format(host, timing))
+
+        if every is not None:
+            if self._rewarm is not None:
+                self._rewarm.cancel()
+
+            self._rewarm = asyncio.ensure_future(self._rewarm_every(every, hosts, connections, timeout))
+
+        return timings
+
+    async def _rewarm_every(self, every, hosts, connections, timeout):
+        while True:
+            await asyncio.sleep(every)
+            await self.warmup(hosts, connections, timeout=timeout)
+
+    async def stored(self, kind, key, fetch, nocache=False):
+        """
+        Returns the stored payload for ``kind``/``key`` if there is a fresh one, otherwise awaits ``fetch()`` and
+        stores its result. With ``nocache`` the payload is always fetched, unless the store is offline.
+        """
+
+        if self.store is None:
+            return await fetch()
+
+        data = None if nocache and not self.store.offline else self.store.get(kind, key)
+        if data is None:
+            data = await fetch()
+            self.store.put(kind, key, data)
+
+        return data
+
     def update_token(self, text):
         # attempts to extract and update token from response
 
@@ -75,18 +313,274 @@ class Session:
         if match:
             return match.group(1)
 
-    def req(self, *args, **kwargs):
+    def req(self, method, url, cache=True, pinned=False, **kwargs):
         # prepared request method
         # use this for ALL API CALLS for CONSISTENCY
+        # pinned reads depend on the signed in account, so they aren't spread over the account pool
 
         headers = kwargs.get("headers", {})
 
+        if pinned:
+            kwargs["pinned"] = True
+
         if self.token is not None:
             headers.setdefault("X-CSRF-TOKEN", self.token)
 
         kwargs["headers"] = headers
 
-        return self.session.request(*args, **kwargs)
+        # payloads are encoded with the session's codec instead of the transport's
+        if "json" in kwargs:
+            kwargs["data"] = self.codec.dumps(kwargs.pop("json"))
+            headers.setdefault("Content-Type", "application/json")
+
+        if method.upper() == "GET":
+            return _RequestContext(within_deadline(self._get(url, cache, **kwargs)))
+
+        # writes make cached reads of the same resource stale
+        if self.cache is not None:
+            self.cache.invalidate(url)
+
+        return _RequestContext(within_deadline(self._read(method, url, **kwargs)))
+
+    async def _get(self, url, use_cache, **kwargs):
+        # serves GETs from the cache when fresh, identical GETs in flight at the same time share one request
+
+        key = request_key("get", url, kwargs.get("params"))
+        cache = self.cache if use_cache else None
+        entry = None
+
+        if cache is not None:
+            entry = cache.get(key)
+            if entry is not None and entry.fresh:
+                cache.stats["hits"] += 1
+                return entry.response
+
+            cache.stats["misses"] += 1
+
+        if self.coalescer is None:
+            return await self._fetch(key, url, cache, entry, **kwargs)
+
+        return await self.coalescer.run(key, lambda: self._fetch(key, url, cache, entry, **kwargs))
+
+    async def _fetch(self, key, url, cache, entry, **kwargs):
+        # revalidates a stale cache entry if possible, and caches what comes back
+
+        if entry is not None and entry.validators:
+            kwargs["headers"] = dict(kwargs["headers"], **entry.validators)
+
+        if self.hedger is None:
+            resp = await self._read("get", url, **kwargs)
+        else:
+            resp = await self.hedger.run(URL(url).host, lambda: self._read("get", url, **kwargs))
+
+        if cache is None:
+            return resp
+
+        ttl = cache.ttl_for(url)
+
+        if resp.status == 304 and entry is not None:
+            cache.stats["revalidated"] += 1
+            cache.refresh(key, ttl)
+            return entry.response
+
+        if ok(resp) and ttl > 0:
+            cache.put(key, resp, ttl)
+
+        return resp
+
+    async def _read(self, method, url, **kwargs):
+        return await Response.read_from(await self._request(method, url, **kwargs), self.codec.loads)
+
+    async def _request(self, method, url, **kwargs):
+        # replays the request once if it was rejected for a missing or rotated CSRF token
+
+        if self.unverified:
+            # concurrent first requests share one check, which doesn't take on any caller's deadline
+            if self._verifying is None or self._verifying.done():
+                self._verifying = without_deadline().run(asyncio.ensure_future, self._verify())
+            await within_deadline(asyncio.shield(self._verifying))
+
+        resp = await self._retry(method, url, **kwargs)
+
+        token = resp.headers.get("x-csrf-token")
+        if resp.status == 403 and token and replayable(kwargs):
+            resp.release()
+
+            self.token = token
+            log.info("Updated XSRF token: {!r}".format(self.token))
+
+            kwargs["headers"]["X-CSRF-TOKEN"] = token
+            resp = await self._retry(method, url, **kwargs)
+
+        return resp
+
+    async def _verify(self):
+        # checks a restored session's cookie before its first request, public endpoints succeed without one
+
+        resp = await self.session.request("GET", ENDPOINTS["users.authenticated"].url())
+        try:
+            if resp.status == 401:
+                raise AuthError("Restored session is no longer authorized")
+            if ok(resp):
+                self.unverified = False
+        finally:
+            resp.release()
+
+    async def _retry(self, method, url, retries=None, **kwargs):
+        # retries idempotent requests that fail with a transient error
+
+        policy = self.retry_policy
+        opts = policy.options(url, retries)
+        policy.budget.deposit()
+
+        attempt = 0
+        failed_at = None
+
+        try:
+            while True:
+                try:
+                    resp = await self._send(method, url, **kwargs)
+                except RETRY_EXCEPTIONS as e:
+                    resp, error = None, e
+                else:
+                    if resp.status not in opts.statuses:
+                        return resp
+
+                    error = resp.status
+
+                if not (replayable(kwargs) and policy.can_retry(method, attempt, opts)):
+                    if failed_at is not None:
+                        policy.stats["gave_up"] += 1
+
+                    if resp is None:
+                        raise error
+                    return resp
+
+                if resp is not None:
+                    resp.release()
+
+                failed_at = failed_at or time.monotonic()
+                delay = policy.delay(attempt, opts)
+                log.info("{} {} failed ({!r}), retry {} in {:.2f}s".format(method.upper(), url, error, attempt + 1,
+                                                                          delay))
+
+                policy.stats["retries"] += 1
+                await asyncio.sleep(delay)
+
+                attempt += 1
+        finally:
+            if failed_at is not None:
+                policy.stats["retry_time"] += time.monotonic() - failed_at
+
+    async def _send(self, method, url, pinned=False, **kwargs):
+        # sends a request through the host's rate limit, waiting out 429s until the wait budget is used up
+
+        if self.store is not None and self.store.offline:
+            raise OfflineError("Offline mode, can't request {} {}".format(method.upper(), url))
+
+        host = URL(url).host
+        limiter = self.rate_limiter
+        scheduler = self.scheduler
+        waited = 0.0
+
+        while True:
+            if self.breaker is not None:
+                self.breaker.check(host)
+
+            # the scheduler picks who waits for the rate limit next, so it goes first
+            if scheduler is not None:
+                await scheduler.acquire(*current_schedule())
+
+            # don't wait for the rate limit past the deadline
+            budget = limiter.max_wait - waited
+            left = deadline_remaining()
+            if left is not None:
+                budget = min(budget, max(left, 0.0))
+
+            account = self.accounts.pick() if method.upper() == "GET" and not pinned else self.accounts.primary
+            key = account.key(host)
+
+            try:
+                try:
+                    waited += await limiter.acquire(key, budget)
+                except RateLimit:
+                    if left is not None and left < limiter.max_wait - waited:
+                        raise DeadlineExceeded("Deadline exceeded waiting for the rate limit of {}".format(host)) \
+                            from None
+                    raise
+
+                account.inflight += 1
+                account.requests += 1
+                try:
+                    resp = await self._send_limited(host, account, method, url, **kwargs)
+                finally:
+                    account.inflight -= 1
+            finally:
+                if scheduler is not None:
+                    scheduler.release()
+
+            backoff = limiter.update(key, resp)
+
+            if resp.status != 429 or not replayable(kwargs):
+                return resp
+
+            resp.release()
+
+            # another account can take over while this one is throttled
+            if len(self.accounts) > 1:
+                self.accounts.bench(account, backoff or None)
+                continue
+
+            if waited + backoff > limiter.max_wait:
+                raise RateLimit("Rate limited by {} for {:.1f}s".format(host, waited + backoff))
+
+    async def _send_limited(self, host, account, method, url, **kwargs):
+        # holds one of the host's concurrency slots until the response headers arrive
+
+        if self.concurrency is not None:
+            await self.concurrency.acquire(host)
+
+        proxy = None
+        if self.proxies is not None:
+            # logged in sessions and writes keep their IP, anonymous reads rotate
+            sticky = account.authenticated or method.upper() != "GET"
+            proxy = self.proxies.assign(account.name if sticky else None)
+
+            try:
+                await proxy.acquire()
+            except BaseException:
+                self._observe(host)
+                raise
+
+            kwargs["proxy"] = proxy.url
+
+        started = time.monotonic()
+
+        try:
+            resp = await account.session.request(method, url, **kwargs)
+        except RETRY_EXCEPTIONS:
+            self._observe(host, error=True, proxy=proxy)
+            raise
+        except BaseException:
+            self._observe(host, proxy=proxy)
+            raise
+
+        self._observe(host, time.monotonic() - started, resp.status, proxy=proxy)
+        return resp
+
+    def _observe(self, host, latency=None, status=None, error=False, proxy=None):
+        # reports how a request went to the policies that adapt to it
+
+        if proxy is not None:
+            proxy.release()
+            if latency is not None or error:
+                self.proxies.record(proxy, error or status == 407)
+
+        if self.concurrency is not None:
+            self.concurrency.release(host, latency, status, error)
+
+        if self.breaker is not None:
+            self.breaker.record(host, latency, status, error)
 
     async def login(self, username=None, password=None):
         """
@@ -99,8 +593,7 @@ class Session:
         }
 
         # first get token
-        async with self.req("get", Url.Roblox + "/login") as resp:
-            self.update_token(await resp.text())
+        await self.refresh_csrf()
 
         async with self.req("post", Url.Auth + "/login", json=payload) as resp:
             if not ok(resp):
@@ -124,22 +617,75 @@ class Session:
                 log.info("Logged in as {!r}".format(self.username))
 
     async def manual_auth(self, username, cookie):
-        cookies = {".ROBLOSECURITY": cookie}
-
-        await self.session.close()
-        self.session = aiohttp.ClientSession(headers={
-            "User-Agent": USER_AGENT
-        }, cookies=cookies)
+        # keep the session (and its pooled connections), only swap the cookie
+        self.session.cookie_jar.update_cookies({".ROBLOSECURITY": cookie})
 
         self.username = username
 
-        async with self.req("get", Url.Roblox + "/home") as resp:
-            if ok(resp):
-                log.info("Opened new session with ROBLOSECURITY cookie")
+        # token is fetched by the first request that needs one
+        if await self.is_authorized():
+            log.info("Opened new session with ROBLOSECURITY cookie")
+        else:
+            raise AuthError("Invalid security cookie")
 
-                self.update_token(await resp.text())
-            else:
-                raise AuthError("Invalid security cookie")
+    def export_state(self):
+        """
+        Returns the authorized session's cookies, XSRF token and username as a JSON serializable dict.
+        """
+
+        cookies = [{
+            "name": cookie.key,
+            "value": cookie.value,
+            "domain": cookie["domain"],
+            "path": cookie["path"],
+            "expires": cookie["expires"],
+            "secure": bool(cookie["secure"]),
+            "httponly": bool(cookie["httponly"])
+        } for cookie in self.session.cookie_jar]
+
+        return {
+            "username": self.username,
+            "token": self.token,
+            "cookies": cookies
+        }
+
+    def import_state(self, state):
+        """
+        Restores a session exported with :meth:`export_state` without any requests. The session is checked once
+        before the first request made with it, which raises :class:`.AuthError` if it's no longer authorized.
+        """
+
+        jar = SimpleCookie()
+        for cookie in state["cookies"]:
+            name = cookie["name"]
+            jar[name] = cookie["value"]
+
+            for attr in ("domain", "path", "expires", "secure", "httponly"):
+                if cookie.get(attr):
+                    jar[name][attr] = cookie[attr]
+
+        self.session.cookie_jar.update_cookies(jar)
+
+        self.username = state.get("username")
+        self.token = state.get("token")
+        self.unverified = True
+
+    async def add_account(self, username, cookie):
+        """
+        Adds an account authorized with a .ROBLOSECURITY cookie to the pool that read requests are spread across.
+        """
+
+        session = self.session.fork({".ROBLOSECURITY": cookie})
+
+        resp = await session.request("GET", ENDPOINTS["users.authenticated"].url())
+        resp.release()
+
+        if not ok(resp):
+            await session.close()
+            raise AuthError("Invalid security cookie for {!r}".format(username))
+
+        log.info("Added account {!r} to the pool".format(username))
+        return self.accounts.add(username, session)
 
     async def logout(self):
         """*
@@ -154,20 +700,130 @@ class Session:
         :return:
         """
 
-        async with self.req("get", Url.Roblox + "/home") as resp:
+        async with self.req("get", ENDPOINTS["users.authenticated"].url(), cache=False, pinned=True) as resp:
             return ok(resp)
 
+    async def check_proxies(self):
+        """
+        Sends a request through every proxy, ejecting the broken ones and readmitting the ones that work again.
+        Returns ``{proxy_url: healthy}``.
+        """
+
+        return await self.proxies.check(self.session)
+
     async def refresh_csrf(self):
-        pass
+        """
+        Fetches a new XSRF token. Requests rejected for a bad token are replayed with a new one automatically, so
+        this is only needed to get a token up front.
+        """
+
+        # a POST without a token is always rejected with a new token in its headers, so this doesn't log out.
+        # bypasses req() so the rejected request isn't replayed with the token
+        resp = await self._retry("post", Url.Auth + "/logout", headers={})
+        token = resp.headers.get("x-csrf-token")
+        resp.release()
+
+        if token:
+            self.token = token
+            log.info("Updated XSRF token: {!r}".format(self.token))
+
+        return self.token
 
     async def my_settings(self):
-        async with self.req("get", Url.Roblox + "/my/settings/json") as resp:
-            if ok(resp):
-                return await resp.json()
-            else:
-                raise AuthError
+        return await self.call("users.settings")
+
+    def apply_endpoint_policies(self, endpoints=None):
+        """
+        Adds the cache TTLs and retry rules of the registered endpoints to the session's cache and retry policy,
+        as URL patterns. Patterns already configured take precedence.
+        """
+
+        default = self.retry_policy.default
+
+        for ep in (endpoints or ENDPOINTS).values():
+            if ep.ttl is not None and self.cache is not None:
+                self.cache.ttls.setdefault(ep.pattern, ep.ttl)
+
+            override = {}
+            if ep.idempotent != (ep.method in default.methods):
+                override["methods"] = default.methods | {ep.method} if ep.idempotent else default.methods - {ep.method}
+            if ep.retries is not None:
+                override["retries"] = ep.retries
+
+            if override:
+                self.retry_policy.overrides.setdefault(ep.pattern, override)
+
+    async def call(self, name, *, params=None, check=True, **kwargs):
+        """
+        Calls a registered endpoint and returns its decoded JSON. Keyword arguments fill in the endpoint's URL,
+        except ``json``, ``data`` and ``headers`` which are sent with the request.
+
+        A batch endpoint's id parameter may be a list; lists longer than the endpoint's batch size are split over
+        several requests sent at once, whose ``data`` lists are joined.
+
+        Raises the exception the endpoint maps the failure to if the response isn't OK, unless ``check`` is false.
+        """
+
+        ep = ENDPOINTS[name]
+        params = dict(params or {})
+
+        if ep.batch is not None:
+            param, size = ep.batch
+            ids = params.get(param)
+
+            if isinstance(ids, (list, tuple, set)):
+                ids = [str(i) for i in ids]
+                chunks = [ids[i:i + size] for i in range(0, len(ids), size)] or [[]]
+
+                if len(chunks) > 1:
+                    pages = await asyncio.gather(*(
+                        self.call(name, params=dict(params, **{param: chunk}), check=check, **kwargs)
+                        for chunk in chunks
+                    ))
+                    return merge_pages(pages)
+
+                params[param] = ",".join(chunks[0])
+
+        options = {k: kwargs.pop(k) for k in ("json", "data", "headers") if k in kwargs}
+        if params:
+            options["params"] = params
+
+        stats = self.endpoint_stats.get(name)
+        if stats is None:
+            stats = self.endpoint_stats[name] = {"calls": 0, "errors": 0, "time": 0.0}
+
+        stats["calls"] += 1
+        started = time.monotonic()
+
+        try:
+            async with self.req(ep.method, ep.url(**kwargs), cache=ep.cache, pinned=ep.pinned, **options) as resp:
+                try:
+                    data = await resp.json()
+                except ValueError:
+                    data = None
+
+                if ok(resp) or not check:
+                    return data
+
+                stats["errors"] += 1
+
+                exc = ep.error(resp.status, data, **dict(params, **kwargs))
+                if exc is None:
+                    exc = RobloxException("{} failed with status {}".format(name, resp.status))
 
-    async def gen_pages(self, url, params=None, data_key="data", sleep=0):
+                raise exc
+        finally:
+            stats["time"] += time.monotonic() - started
+
+    def pages(self, name, params=None, sleep=0, **kwargs):
+        """
+        Iterates over the items of a cursor paged endpoint.
+        """
+
+        ep = ENDPOINTS[name]
+        return self.gen_pages(ep.url(**kwargs), params, sleep=sleep, pinned=ep.pinned)
+
+    async def gen_pages(self, url, params=None, data_key="data", sleep=0, pinned=False):
         # turns paged API into a generator
 
         params = params or {}
@@ -177,7 +833,7 @@ class Session:
         while True:
             log.debug("page {}".format(i))
 
-            async with self.req("get", url, params=params) as resp:
+            async with self.req("get", url, params=params, pinned=pinned) as resp:
                 data = await resp.json()
                 for item in data.get(data_key, []):
                     yield item
@@ -193,244 +849,262 @@ class Session:
 
             i += 1
 
+    def loader(self, name, fetch, missing=KeyError):
+        """
+        Returns the :class:`.Batcher` sending lookups to the bulk endpoint ``name``, creating it with ``fetch`` on
+        first use.
+        """
+
+        batcher = self.loaders.get(name)
+        if batcher is None:
+            batcher = self.loaders[name] = Batcher(fetch, ENDPOINTS[name].batch[1], self.batch_window, missing)
+
+        return batcher
+
     async def get_by_username(self, username):
         """
-        Gets user Id and Username
+        Gets user Id, batched with other username lookups
         """
 
-        async with self.req("get", Url.Api + "/users/get-by-username", params={"username": username}) as resp:
-            if not ok(resp):
-                raise UserIdentificationError("User {!r} not found".format(username))
+        batcher = self.loader("users.by_usernames", self._fetch_usernames,
+                              lambda name: UserIdentificationError("User {!r} not found".format(name)))
+
+        return await batcher.load(username.lower())
+
+    async def _fetch_usernames(self, usernames):
+        payload = {
+            "usernames": usernames,
+            "excludeBannedUsers": False
+        }
+
+        data = await self.call("users.by_usernames", json=payload)
+        return {user["requestedUsername"].lower(): {"id": user["id"]} for user in data["data"]}
+
+    async def get_user_summary(self, user_id):
+        """
+        Gets user Id, username and display name, batched with other lookups. Unlike get_user_data this doesn't
+        include the description or creation date. Served from the entity store when it has the user's profile.
+        """
+
+        if self.store is not None:
+            data = self.store.get("user", user_id)
+            if data is not None:
+                return data
+
+        batcher = self.loader("users.by_ids", self._fetch_users,
+                              lambda user_id: UserIdentificationError("User {!r} not found".format(user_id)))
 
-            return {"id": (await resp.json())["Id"]}
+        return await batcher.load(int(user_id))
+
+    async def _fetch_users(self, user_ids):
+        payload = {
+            "userIds": user_ids,
+            "excludeBannedUsers": False
+        }
+
+        data = await self.call("users.by_ids", json=payload)
+        return {user["id"]: user for user in data["data"]}
+
+    async def get_presence(self, user_id):
+        """
+        Gets a user's presence, batched with other presence lookups.
+        """
+
+        batcher = self.loader("users.presence", self._fetch_presences,
+                              lambda user_id: UserIdentificationError("User {!r} not found".format(user_id)))
+
+        return await batcher.load(int(user_id))
+
+    async def _fetch_presences(self, user_ids):
+        data = await self.call("users.presence", json={"userIds": user_ids})
+        return {presence["userId"]: presence for presence in data["userPresences"]}
 
     async def get_user_data(self, user_id):
-        async with self.req("get", Url.Users + "/users/{}".format(user_id)) as resp:
-            if ok(resp):
-                return await resp.json()
-            else:
-                raise UserIdentificationError("User {!r} not found".format(user_id))
+        return await self.call("users.get", user_id=user_id)
 
     async def is_premium(self, user_id):
-        async with self.req("get", Url.Premium + "/users/{}/validate-membership".format(user_id)) as resp:
-            if ok(resp):
-                return await resp.json()
-            else:
-                raise AuthError
+        return await self.call("users.premium", user_id=user_id)
 
     async def user_status(self, user_id):
-        async with self.req("get", Url.Users + "/users/{}/status".format(user_id)) as resp:
-            if ok(resp):
-                return await resp.json()
-            else:
-                raise UserIdentificationError("User {!r} not found".format(user_id))
+        return await self.call("users.status", user_id=user_id)
 
     async def post_status(self, user_id, status):
         payload = {
             "status": status
         }
 
-        async with self.req("patch", Url.Users + "/users/{}/status".format(user_id), json=payload) as resp:
-            if ok(resp):
-                return await resp.json()
-            else:
-                if resp.status == 403:
-                    raise AuthError("Not authorized to update status")
-                else:
-                    raise UserError
+        return await self.call("users.set_status", user_id=user_id, json=payload)
 
     async def get_user_friends(self, user_id):
-        async with self.req("get", Url.Friends + "/users/{}/friends".format(user_id)) as resp:
-            if resp.status == 404:
-                raise UserIdentificationError("User {!r} not found".format(user_id))
-
-            return (await resp.json())["data"]
+        return (await self.call("friends.list", user_id=user_id))["data"]
 
     async def check_status(self, user_id, compare):
         if isinstance(compare, int):
             compare = [compare]
 
-        url = Url.Friends + "/users/{}/friends/statuses".format(user_id)
-        params = {"userIds": ",".join([str(c) for c in compare])}
-
-        async with self.req("get", url, params=params) as resp:
-            data = await resp.json()
-
-            if not ok(resp):
-                err = data["errors"][0]["code"]
-                if err == 1:
-                    raise UserIdentificationError("Target user is invalid or does not exist")
-                else:
-                    raise UserError
-
-            if ok(resp):
-                return data["data"]
+        data = await self.call("friends.statuses", user_id=user_id, params={"userIds": compare})
+        return data["data"]
 
     async def unfriend(self, user_id):
-        async with self.req("post", Url.Friends + "/users/{}/unfriend".format(user_id)) as resp:
-            if ok(resp):
-                return True
-            else:
-                if resp.status == 400:
-                    raise UserIdentificationError
-                else:
-                    raise UserError
+        await self.call("friends.unfriend", user_id=user_id)
+        return True
 
     async def get_friend_requests(self):
-        async for data in self.gen_pages(Url.Friends + "/my/friends/requests"):
+        async for data in self.pages("friends.requests"):
             yield data
 
     async def friend_request_count(self):
-        async with self.req("get", Url.Friends + "/user/friend-requests/count") as resp:
-            if ok(resp):
-                return (await resp.json())["count"]
-            else:
-                raise AuthError
+        return (await self.call("friends.request_count"))["count"]
 
     async def decline_all_friend_requests(self):
-        async with self.req("post", Url.Friends + "/user/friend-requests/decline-all",
-                            headers={"Host": "friends.roblox.com"}) as resp:
-            if ok(resp):
-                return True
-            else:
-                raise AuthError(await resp.text())
+        await self.call("friends.decline_all", headers={"Host": "friends.roblox.com"})
+        return True
 
     async def accept_friend_request(self, user_id):
-        async with self.req("post", Url.Friends + "/users/{}/accept-friend-request".format(user_id)) as resp:
-            if not ok(resp):
-                data = await resp.json()
-                err = data["errors"][0]
-
-                if err["code"] == 1:
-                    raise UserIdentificationError("User {!r} not found".format(user_id))
-                elif err["code"] == 10:
-                    raise UserError("Friend request does not exist")
-                elif err["code"] in (11, 12):
-                    raise FriendLimitExceeded("Friend limit exceeded")
-            else:
-                return True
+        await self.call("friends.accept", user_id=user_id)
+        return True
 
     async def decline_friend_request(self, user_id):
-        async with self.req("post", Url.Friends + "/users/{}/decline-friend-request".format(user_id)) as resp:
-            if not ok(resp):
-                data = await resp.json()
-                err = data["errors"][0]
-
-                if err["code"] == 1:
-                    raise UserIdentificationError("User {!r} not found".format(user_id))
-                elif err["code"] == 10:
-                    raise UserError("Friend request does not exist")
-            else:
-                return True
+        await self.call("friends.decline", user_id=user_id)
+        return True
 
     async def request_friendship(self, user_id):
-        async with self.req("post", Url.Friends + "/users/{}/request-friendship".format(user_id)) as resp:
-            data = await resp.json()
+        data = await self.call("friends.request", user_id=user_id, check=False)
 
-            if data.get("success", False):
-                return True
-            elif data.get("isCaptchaRequired", False):
-                raise Captcha("Captcha required")
-            else:
-                code = data["errors"][0]["code"]
-                if code == 1:
-                    raise UserIdentificationError
-                elif code == 5:
-                    raise UserError("Already friends with {!r}".format(user_id))
-                elif code == 7:
-                    raise UserError("Can't send friend request to self")
-                elif code == 10:
-                    raise UserIdentificationError("User {!r} doesn't exist".format(user_id))
-                else:
-                    raise UserError("{}".format(code))
-
-    # async def unfriend(self, user_id):
-    #     async with self.req("post", Url.Friends + "/users/{}/unfriend".format(user_id)) as resp:
-    #         data = await resp.json()
-    #
-    #         if data.get("success", False):
-    #             return True
-    #         elif data.get("isCaptchaRequired", False):
-    #             raise Captcha("Captcha required")
-    #         else:
-    #             code = data["errors"][0]["code"]
-    #             if code == 1:
-    #                 raise UserIdentificationError
-    #             elif code == 5:
-    #                 raise UserError("Not friends with {!r}".format(user_id))
-    #             elif code == 7:
-    #                 raise UserError("Can't unfriend self")
-    #             elif code == 10:
-    #                 raise UserIdentificationError("User {!r} doesn't exist".format(user_id))
-    #             else:
-    #                 raise UserError("{}".format(code))
+        if data.get("success", False):
+            return True
+        elif data.get("isCaptchaRequired", False):
+            raise Captcha("Captcha required")
+        else:
+            raise ENDPOINTS["friends.request"].error(None, data, user_id=user_id)
 
     async def follow(self, user_id):
-        async with self.req("post", Url.Friends + "/users/{}/follow".format(user_id)) as resp:
-            if ok(resp):
-                return True
-            else:
-                print(await resp.json())
-                if resp.status == 400:
-                    raise UserIdentificationError
-                else:
-                    raise UserError
+        await self.call("friends.follow", user_id=user_id)
+        return True
 
     async def unfollow(self, user_id):
-        async with self.req("post", Url.Friends + "/users/{}/unfollow".format(user_id)) as resp:
-            if ok(resp):
-                return True
-            else:
-                if resp.status == 400:
-                    raise UserIdentificationError
-                else:
-                    raise UserError
+        await self.call("friends.unfollow", user_id=user_id)
+        return True
 
     async def follower_count(self, user_id):
-        async with self.req("get", Url.Friends + "/users/{}/followers/count".format(user_id)) as resp:
-            if ok(resp):
-                return (await resp.json())["count"]
-            else:
-                if resp.status == 400:
-                    raise UserIdentificationError
-                else:
-                    raise UserError
+        return (await self.call("friends.followers_count", user_id=user_id))["count"]
 
     async def followers(self, user_id):
-        async for data in self.gen_pages(Url.Friends + "/users/{}/followers".format(user_id)):
+        async for data in self.pages("friends.followers", user_id=user_id):
             yield data
 
     async def followings_count(self, user_id):
-        async with self.req("get", Url.Friends + "/users/{}/followings/count".format(user_id)) as resp:
-            if ok(resp):
-                return (await resp.json())["count"]
-            else:
-                if resp.status == 400:
-                    raise UserIdentificationError
-                else:
-                    raise UserError
+        return (await self.call("friends.followings_count", user_id=user_id))["count"]
 
     async def followings(self, user_id):
-        async for data in self.gen_pages(Url.Friends + "/users/{}/followings".format(user_id)):
+        async for data in self.pages("friends.followings", user_id=user_id):
             yield data
 
     async def inventory_by_type(self, user_id, asset_type):
-        async for data in self.gen_pages(Url.Inventory + "/users/{}/inventory/{}".format(user_id, asset_type)):
+        async for data in self.pages("inventory.by_type", user_id=user_id, asset_type=asset_type):
             yield data
 
     async def product_info(self, asset_id):
-        async with self.req("get", Url.Api + "/marketplace/productinfo", params={"assetId": asset_id}) as resp:
-            if ok(resp):
-                return await resp.json()
-            else:
-                raise AssetNotFound
+        return await self.call("assets.product_info", params={"assetId": asset_id})
+
+    async def load_catalog_details(self, asset_id):
+        """
+        Gets an asset's catalog item details, batched with other asset lookups. Only avatar items are in the
+        catalog, other assets raise AssetNotFound.
+        """
+
+        batcher = self.loader("catalog.details", self._fetch_catalog_details,
+                              lambda asset_id: AssetNotFound("Asset {!r} isn't in the catalog".format(asset_id)))
+
+        return await batcher.load(int(asset_id))
+
+    async def _fetch_catalog_details(self, asset_ids):
+        payload = {
+            "items": [{"itemType": "Asset", "id": asset_id} for asset_id in asset_ids]
+        }
+
+        data = await self.call("catalog.details", json=payload)
+        return {item["id"]: item for item in data["data"] if item.get("itemType") == "Asset"}
+
+    async def get_thumbnails(self, name, target_ids, size, format="Png", circular=False):
+        """
+        Gets the image URLs of several thumbnails from the thumbnails endpoint ``name``, e.g.
+        ``"thumbnails.avatar"``, batched with other lookups of the same endpoint. Returns ``{id: url}``, with
+        ``None`` for thumbnails that are blocked or couldn't be rendered in time.
+        """
+
+        batcher = self.loader(name, lambda keys: self._fetch_thumbnails(name, keys),
+                              lambda key: RobloxException("No thumbnail for {!r}".format(key[-1])))
+
+        urls, missed = {}, []
+        for target_id in target_ids:
+            key = (name, size, format, circular, int(target_id))
+
+            if self.thumbnail_cache is not None:
+                hit, url = self.thumbnail_cache.get(key)
+                if hit:
+                    urls[key[-1]] = url
+                    continue
+
+            missed.append(key)
+
+        items = await asyncio.gather(*(batcher.load(key[1:]) for key in missed))
+        for key, item in zip(missed, items):
+            url = item["imageUrl"] if item["state"] == "Completed" else None
+            urls[key[-1]] = url
+
+            if self.thumbnail_cache is not None and item["state"] in ("Completed", "Blocked", "Error"):
+                self.thumbnail_cache.put(key, url)
+
+        return urls
+
+    async def get_thumbnail(self, name, target_id, size, format="Png", circular=False):
+        """
+        Gets the image URL of a thumbnail, see :meth:`get_thumbnails`.
+        """
+
+        urls = await self.get_thumbnails(name, [target_id], size, format, circular)
+        return urls[int(target_id)]
+
+    async def _fetch_thumbnails(self, name, keys):
+        # keys are (size, format, circular, id), one request per kind of thumbnail in the batch
+
+        ids = {}
+        for key in keys:
+            ids.setdefault(key[:-1], []).append(key[-1])
+
+        results = {}
+        await asyncio.gather(*(self._poll_thumbnails(name, options, target_ids, results)
+                               for options, target_ids in ids.items()))
+
+        return results
+
+    async def _poll_thumbnails(self, name, options, target_ids, results):
+        size, format, circular = options
+        param = ENDPOINTS[name].batch[0]
+
+        for attempt in range(POLL_ATTEMPTS):
+            data = await self.call(name, params={
+                param: target_ids,
+                "size": size,
+                "format": format,
+                "isCircular": "true" if circular else "false"
+            })
+
+            # only the ones still rendering are requested again
+            target_ids = []
+            for item in data["data"]:
+                results[options + (item["targetId"],)] = item
+                if item["state"] == "Pending":
+                    target_ids.append(item["targetId"])
+
+            if not target_ids or attempt == POLL_ATTEMPTS - 1:
+                break
+
+            await asyncio.sleep(POLL_INTERVAL)
 
     async def get_currency(self, user_id):
-        async with self.req("get", Url.Economy + "/users/{}/currency".format(user_id)) as resp:
-            if ok(resp):
-                return await resp.json()
-            else:
-                raise AuthError
+        return await self.call("economy.currency", user_id=user_id)
 
     async def purchase_product(self, product_id, expected_price, expected_seller):
         payload = {
@@ -439,143 +1113,90 @@ class Session:
             "expectedSellerId": expected_seller
         }
 
-        async with self.req("post", Url.Economy + "/purchases/products/{}".format(product_id), json=payload) as resp:
-            data = await resp.json()
-            if data["purchased"]:
-                return data
+        data = await self.call("economy.purchase", product_id=product_id, json=payload, check=False)
+        if data["purchased"]:
+            return data
+        else:
+            reason = data.get("reason")
+            if reason == "InvalidArguments":
+                raise PurchaseError(data.get("errorMsg"))
+            elif reason == "PriceChanged":
+                raise PriceChanged(data.get("errorMsg"))
             else:
-                reason = data.get("reason")
-                if reason == "InvalidArguments":
-                    raise PurchaseError(data.get("errorMsg"))
-                elif reason == "PriceChanged":
-                    raise PriceChanged(data.get("errorMsg"))
-                else:
-                    raise PurchaseError(data.get("errorMsg"))
+                raise PurchaseError(data.get("errorMsg"))
 
     async def has_asset(self, user_id, asset_id):
-        async with self.req("get", Url.Api + "/ownership/hasasset", params={"userId": user_id,
-                                                                            "assetId": asset_id}) as resp:
-            if ok(resp):
-                return await resp.json()
-            else:
-                raise UserError(await resp.text())
+        return await self.call("inventory.has_asset", params={"userId": user_id, "assetId": asset_id})
 
     async def favorites_count(self, asset_id):
-        async with self.req("get", Url.Catalog + "/favorites/assets/{}/count".format(asset_id)) as resp:
-            if ok(resp):
-                return await resp.json()
-            else:
-                raise AssetNotFound
+        return await self.call("favorites.count", asset_id=asset_id)
 
     async def favorite_model(self, user_id, asset_id):
-        async with self.req("get",
-                            Url.Catalog + "/favorites/users/{}/assets/{}/favorite".format(user_id, asset_id)) as resp:
-            return await resp.json()
+        return await self.call("favorites.get", user_id=user_id, asset_id=asset_id, check=False)
 
     async def delete_favorite(self, user_id, asset_id):
-        async with self.req("delete",
-                            Url.Catalog + "/favorites/users/{}/assets/{}/favorite".format(user_id, asset_id)) as resp:
-            if ok(resp):
-                return True
-            else:
-                data = await resp.json()
-                code = data["errors"][0]["code"]
-
-                if resp.status == 400:
-                    raise AssetNotFound
-                elif resp.status == 403:
-                    if code in (0, 6):
-                        raise AuthError
-                    elif code == 7:
-                        raise Captcha
-                elif resp.status == 409:
-                    raise AssetError("Asset already not favorited")
+        await self.call("favorites.delete", user_id=user_id, asset_id=asset_id)
+        return True
 
     async def create_favorite(self, user_id, asset_id):
-        async with self.req("post",
-                            Url.Catalog + "/favorites/users/{}/assets/{}/favorite".format(user_id, asset_id)) as resp:
-            if ok(resp):
-                return True
-            else:
-                data = await resp.json()
-                code = data["errors"][0]["code"]
-
-                if resp.status == 400:
-                    raise AssetNotFound
-                elif resp.status == 403:
-                    if code in (0, 6):
-                        raise AuthError
-                    elif code == 7:
-                        raise Captcha
-                elif resp.status == 409:
-                    raise AssetError("Asset already favorited")
+        await self.call("favorites.create", user_id=user_id, asset_id=asset_id)
+        return True
 
     async def universe_favorited(self, universe_id):
-        async with self.req("get", Url.Game1 + "/games/{}/favorites".format(universe_id)) as resp:
-            if ok(resp):
-                return await resp.json()
-            elif resp.status == 400:
-                raise GameNotFound("Invalid Root Place")
-            elif resp.status == 401:
-                raise AuthError
-            elif resp.status == 400:
-                raise GameNotFound
+        return await self.call("games.favorited", universe_id=universe_id)
 
     async def universe_favorites(self, universe_id):
-        async with self.req("get", Url.Game1 + "/games/{}/favorites/count".format(universe_id)) as resp:
-            if ok(resp):
-                return await resp.json()
-            elif resp.status == 400:
-                raise GameNotFound("Invalid Root Place")
-            elif resp.status == 401:
-                raise AuthError
-            elif resp.status == 400:
-                raise GameNotFound
+        return await self.call("games.favorites_count", universe_id=universe_id)
 
     async def favorite_universe(self, universe_id, favorite):
         payload = {
             "isFavorited": favorite
         }
-        async with self.req("post", Url.Game1 + "/games/{}/favorites".format(universe_id), json=payload) as resp:
-            data = await resp.json()
-            if ok(resp):
-                return data
-            elif resp.status == 400:
-                raise GameNotFound("Invalid Root Place")
-            elif resp.status == 401:
-                raise AuthError
-            elif resp.status == 400:
-                raise GameNotFound
-            else:
-                raise UserError(str(data))
+
+        return await self.call("games.favorite", universe_id=universe_id, json=payload)
 
     async def get_place_details(self, *place_id):
-        ids = ",".join([str(i) for i in place_id])
-        async with self.req("get", Url.Game1 + "/games/multiget-place-details", params={"placeIds": ids}) as resp:
-            if ok(resp):
-                return await resp.json()
-            else:
-                raise GameNotFound
+        return await self.call("games.place_details", params={"placeIds": place_id})
 
     async def get_game_details(self, *universe_id):
-        ids = ",".join([str(i) for i in universe_id])
-        async with self.req("get", Url.Game1 + "/games", params={"universeIds": ids}) as resp:
-            if ok(resp):
-                return await resp.json()
-            else:
-                raise GameNotFound
+        return await self.call("games.details", params={"universeIds": universe_id})
+
+    async def load_place_details(self, place_id):
+        """
+        Gets a place's details, batched with other place lookups
+        """
+
+        batcher = self.loader("games.place_details", self._fetch_place_details,
+                              lambda place_id: GameNotFound("Couldn't find place {!r}".format(place_id)))
+
+        return await batcher.load(int(place_id))
+
+    async def _fetch_place_details(self, place_ids):
+        return {place["placeId"]: place for place in await self.get_place_details(*place_ids)}
+
+    async def load_game_details(self, universe_id):
+        """
+        Gets a universe's details, batched with other universe lookups
+        """
+
+        batcher = self.loader("games.details", self._fetch_game_details,
+                              lambda universe_id: GameNotFound("Couldn't find universe {!r}".format(universe_id)))
+
+        return await batcher.load(int(universe_id))
+
+    async def _fetch_game_details(self, universe_ids):
+        return {game["id"]: game for game in (await self.get_game_details(*universe_ids))["data"]}
 
     async def get_user_games(self, user_id, access_filter=None):
         p = {}
         if access_filter is not None:
             p["accessFilter"] = access_filter
 
-        async for data in self.gen_pages(Url.Game2 + "/users/{}/games".format(user_id),
-                                         params=p):
+        async for data in self.pages("games.by_user", params=p, user_id=user_id):
             yield data
 
     async def download_asset(self, asset_id, fp):
-        async with self.req("get", Url.AssetDelivery + "/asset/", params={"id": asset_id}) as resp:
+        async with self.req("get", ENDPOINTS["assets.download"].url(), params={"id": asset_id}, pinned=True) as resp:
             if ok(resp):
                 content = await resp.read()
                 encoding = chardet.detect(content)["encoding"]
@@ -585,7 +1206,7 @@ class Session:
                         log.debug("xml content redirect")
                         real_url = url.search(text)
                         if real_url:
-                            async with self.req("get", real_url.group(1)) as content:
+                            async with self.req("get", real_url.group(1), pinned=True) as content:
                                 if not ok(resp):
                                     if resp.status == 403:
                                         raise AuthError("No permission to download asset")
@@ -595,56 +1216,69 @@ class Session:
                 else:
                     fp.write(await resp.read())
             else:
-                if resp.status == 409:
-                    raise AuthError("Not authorized to download asset")
+                exc = ENDPOINTS["assets.download"].error(resp.status)
+                if exc is not None:
+                    raise exc
 
     async def delete_from_inventory(self, asset_id):
-        async with self.req("post", Url.Roblox + "/asset/delete-from-inventory", params={"assetId": asset_id}) as resp:
-            if ok(resp):
-                return True
-            else:
-                raise AssetError
+        await self.call("inventory.delete", params={"assetId": asset_id})
+        return True
 
     async def get_group_details(self, group_id):
-        async with self.req("get", Url.Group1 + "/groups/{}".format(group_id)) as resp:
-            if ok(resp):
-                return await resp.json()
-            else:
-                raise GroupNotFound("Couldn't find group {!r}".format(group_id))
+        return await self.call("groups.get", group_id=group_id)
+
+    async def load_group_summary(self, group_id):
+        """
+        Gets a group's name and description, batched with other group lookups. Served from the entity store when it
+        has the group's full details.
+        """
+
+        if self.store is not None:
+            data = self.store.get("group", group_id)
+            if data is not None:
+                return data
+
+        batcher = self.loader("groups.multi", self._fetch_groups,
+                              lambda group_id: GroupNotFound("Couldn't find group {!r}".format(group_id)))
+
+        return await batcher.load(int(group_id))
+
+    async def _fetch_groups(self, group_ids):
+        data = await self.call("groups.multi", params={"groupIds": group_ids})
+        return {group["id"]: group for group in data["data"]}
 
     async def get_group_roles(self, group_id):
-        async with self.req("get", Url.Group1 + "/groups/{}/roles".format(group_id)) as resp:
-            if ok(resp):
-                return await resp.json()
-            else:
-                raise GroupNotFound("Couldn't find group {!r}".format(group_id))
+        return await self.call("groups.roles", group_id=group_id)
 
     async def get_group_members(self, group_id):
-        async for data in self.gen_pages(Url.Group1 + "/groups/{}/users".format(group_id)):
+        async for data in self.pages("groups.members", group_id=group_id):
             yield data
 
     async def get_role_details(self, *role_id):
-        role_ids = ",".join([str(i) for i in role_id])
-        async with self.req("get", Url.Group1 + "/roles", params={"ids": role_ids}) as resp:
-            if ok(resp):
-                return await resp.json()
-            else:
-                raise RoleNotFound
+        return await self.call("groups.role_details", params={"ids": role_id})
+
+    async def load_role_details(self, role_id):
+        """
+        Gets a role's details, batched with other role lookups
+        """
+
+        batcher = self.loader("groups.role_details", self._fetch_roles,
+                              lambda role_id: RoleNotFound("Couldn't find role {!r}".format(role_id)))
+
+        return await batcher.load(int(role_id))
+
+    async def _fetch_roles(self, role_ids):
+        return {role["id"]: role for role in (await self.get_role_details(*role_ids))["data"]}
 
     async def get_user_roles(self, user_id):
-        async with self.req("get", Url.Group1 + "/users/{}/groups/roles".format(user_id)) as resp:
-            if ok(resp):
-                return await resp.json()
-            else:
-                print(await resp.text())
-                raise UserError
+        return await self.call("users.roles", user_id=user_id)
 
     async def upload_asset(self, file, name, asset_type, group_id=None):
         rvturl = Url.Roblox + "/develop"
         if group_id is not None:
             rvturl = Url.Roblox + "/develop/groups/{}".format(group_id)
 
-        async with self.req("get", rvturl, params={"View": asset_type}) as resp:
+        async with self.req("get", rvturl, params={"View": asset_type}, pinned=True) as resp:
             rvt = self.get_rvt(await resp.text())
             if rvt is None:
                 print(resp.status, resp.url)
@@ -666,7 +1300,7 @@ class Session:
         if group_id is not None:
             form.add_field("groupId", str(group_id))
 
-        async with self.req("post", Url.Roblox + "/build/upload", data=form) as resp:
+        async with self.req("post", ENDPOINTS["assets.upload"].url(), data=form) as resp:
             print(resp.status)
             print(resp.url)
             return ok(resp)
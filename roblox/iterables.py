@@ -1,5 +1,26 @@
 import inspect
 
+from roblox.scheduler import scheduling
+
+
+class _Scheduled:
+    # tags the requests made while fetching each item, without tagging the consumer's code in between
+
+    __slots__ = ("_it", "_priority", "_tenant")
+
+    def __init__(self, it, priority, tenant):
+        self._it = it
+        self._priority = priority
+        self._tenant = tenant
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        with scheduling(self._priority, self._tenant):
+            return await self._it.__anext__()
+
+
 class AsyncIterator:
     """
     Async Iterator. You can iterate over this using the ``async for`` syntax::
@@ -18,6 +39,19 @@ class AsyncIterator:
     def __aiter__(self):
         return self._gen
 
+    def scheduled(self, priority, tenant=None):
+        """
+        Returns an iterator over the same items whose requests are tagged with a priority class and tenant, see
+        :class:`.Scheduler`::
+
+            async for member in group.members.scheduled("bulk", tenant="crawler"):
+                ...
+
+        :rtype: :class:`.AsyncIterator`
+        """
+
+        return AsyncIterator(gen=_Scheduled(self.__aiter__(), priority, tenant), state=self._state)
+
     async def flatten(self, limit=None):
         """
         Flattens iterator to a list of items.
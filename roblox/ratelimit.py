@@ -0,0 +1,327 @@
+# Client side rate limiting for the API hosts
+import asyncio
+import logging
+import mmap
+import os
+import struct
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+
+try:
+    import fcntl
+except ImportError:  # windows
+    fcntl = None
+
+from roblox.errors import RateLimit
+
+log = logging.getLogger(__name__)
+
+
+def parse_retry_after(value, default=None):
+    # Retry-After is either a number of seconds or an HTTP date
+
+    if value is None:
+        return default
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return default
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at ``rate`` tokens per second, holding at most ``burst`` tokens.
+
+    Tokens are reserved rather than taken, so the bucket may go negative; the size of the debt is the time the
+    caller has to wait before its request may be sent.
+    """
+
+    __slots__ = ("rate", "burst", "tokens", "updated", "blocked_until")
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+
+    def _refill(self, now):
+        if self.rate is not None:
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def _delay(self, now):
+        self._refill(now)
+
+        wait = max(0.0, self.blocked_until - now)
+        if self.rate is not None and self.tokens < 1:
+            wait = max(wait, (1 - self.tokens) / self.rate)
+
+        return wait
+
+    def delay(self):
+        # seconds until a token could be reserved, without reserving it
+        return self._delay(time.monotonic())
+
+    def reserve(self, max_delay=None):
+        """
+        Reserves a token and returns how long the caller must wait before using it. If the wait would be longer
+        than ``max_delay``, nothing is reserved and the required wait is returned.
+        """
+
+        wait = self._delay(time.monotonic())
+
+        if max_delay is not None and wait > max_delay:
+            return wait
+
+        if self.rate is not None:
+            self.tokens -= 1
+
+        return wait
+
+    def block(self, seconds):
+        # stop handing out tokens for the next `seconds`
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+    def clamp(self, remaining):
+        # server says we have `remaining` requests left, never think we have more
+        self._refill(time.monotonic())
+        self.tokens = min(self.tokens, float(remaining))
+
+
+class RateLimiter:
+    """
+    Per-host token bucket rate limiter used by :class:`.Session` for every request.
+
+    Rate limit headers sent by the API (``Retry-After`` and ``x-ratelimit-*``) slow the matching bucket down before
+    the server starts rejecting requests. A request only fails with :class:`.RateLimit` once it has waited longer
+    than ``max_wait`` seconds in total.
+
+    Args:
+        rate: Requests per second allowed for each host. ``None`` disables client side throttling, leaving only
+              server-driven waits.
+        burst: Number of requests that can be sent at once before throttling starts. Defaults to ``rate``.
+        max_wait: Total number of seconds a single request may spend waiting for the rate limit.
+        hosts: Mapping of host name to ``(rate, burst)`` overriding the defaults, e.g.
+               ``{"friends.roblox.com": (5, 10)}``.
+        default_retry_after: Seconds to back off after a 429 response without a ``Retry-After`` header.
+    """
+
+    def __init__(self, rate=20.0, burst=None, max_wait=60.0, hosts=None, default_retry_after=1.0):
+        self.rate = rate
+        self.burst = burst or max(1, int(rate or 1))
+        self.max_wait = max_wait
+        self.hosts = dict(hosts or {})
+        self.default_retry_after = default_retry_after
+
+        self._buckets = {}
+
+    def _limits(self, host):
+        # buckets of pooled accounts are keyed "account@host"
+        rate, burst = self.hosts.get(host.rpartition("@")[2], (self.rate, self.burst))
+        return rate, burst or max(1, int(rate or 1))
+
+    def _new_bucket(self, host):
+        return TokenBucket(*self._limits(host))
+
+    def bucket(self, host):
+        """
+        Returns the :class:`TokenBucket` for a host, creating it if needed.
+        """
+
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = self._new_bucket(host)
+
+        return bucket
+
+    async def acquire(self, host, budget=None):
+        """|coro|
+
+        Waits until a request to ``host`` may be sent and returns the number of seconds waited.
+
+        Raises:
+            :class:`.RateLimit` if the wait would exceed ``budget`` (defaults to ``max_wait``).
+        """
+
+        budget = self.max_wait if budget is None else budget
+        wait = self.bucket(host).reserve(budget)
+
+        if wait > budget:
+            raise RateLimit("Rate limit for {} exceeded, would wait {:.1f}s".format(host, wait))
+
+        if wait > 0:
+            log.debug("rate limited on {}, waiting {:.2f}s".format(host, wait))
+            await asyncio.sleep(wait)
+
+        return wait
+
+    def update(self, host, resp):
+        """
+        Updates a host's bucket from a response's rate limit headers. Returns the number of seconds the host is
+        blocked for, which is non-zero after a 429 or when the server reports no remaining requests.
+        """
+
+        bucket = self.bucket(host)
+        headers = resp.headers
+
+        if resp.status == 429:
+            wait = parse_retry_after(headers.get("Retry-After"), self.default_retry_after)
+            log.warning("429 from {}, backing off {:.1f}s".format(host, wait))
+            bucket.block(wait)
+            return wait
+
+        remaining = headers.get("x-ratelimit-remaining")
+        if remaining is None:
+            return 0.0
+
+        try:
+            remaining = float(remaining)
+        except ValueError:
+            return 0.0
+
+        bucket.clamp(remaining)
+
+        if remaining <= 0:
+            wait = parse_retry_after(headers.get("x-ratelimit-reset", headers.get("Retry-After")),
+                                     self.default_retry_after)
+            bucket.block(wait)
+            return wait
+
+        return 0.0
+
+
+class SharedBucketTable:
+    """
+    Fixed size table of token bucket states in a memory mapped file, locked with :func:`fcntl.flock` so every
+    process mapping the same file sees and updates the same buckets.
+    """
+
+    # host name, tokens, last refill, blocked until
+    SLOT = struct.Struct("<64sddd")
+
+    def __init__(self, path, slots=256):
+        if fcntl is None:
+            raise RuntimeError("Shared rate limits require fcntl, which isn't available on this platform")
+
+        self.path = path
+        self.slots = slots
+        self.size = self.SLOT.size * slots
+
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+
+        with self.locked():
+            if os.fstat(self._fd).st_size < self.size:
+                os.ftruncate(self._fd, self.size)
+
+        self._map = mmap.mmap(self._fd, self.size)
+
+    @contextmanager
+    def locked(self):
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def slot(self, host):
+        # finds or claims the slot for a host, returns its index
+
+        name = host.encode()[:64]
+
+        with self.locked():
+            for i in range(self.slots):
+                stored = self.SLOT.unpack_from(self._map, i * self.SLOT.size)[0].rstrip(b"\0")
+
+                if stored == name:
+                    return i
+                if not stored:
+                    self.SLOT.pack_into(self._map, i * self.SLOT.size, name, 0.0, 0.0, 0.0)
+                    return i
+
+        raise RuntimeError("Shared rate limit table {!r} is full".format(self.path))
+
+    def load(self, i):
+        return self.SLOT.unpack_from(self._map, i * self.SLOT.size)[1:]
+
+    def save(self, i, name, tokens, updated, blocked_until):
+        self.SLOT.pack_into(self._map, i * self.SLOT.size, name, tokens, updated, blocked_until)
+
+    def close(self):
+        self._map.close()
+        os.close(self._fd)
+
+
+class SharedTokenBucket(TokenBucket):
+    """
+    :class:`TokenBucket` whose state lives in a :class:`SharedBucketTable`. Every operation locks the table, loads
+    the state, updates it and writes it back.
+    """
+
+    __slots__ = ("_table", "_slot", "_name")
+
+    def __init__(self, table, host, rate, burst):
+        super().__init__(rate, burst)
+
+        self._table = table
+        self._slot = table.slot(host)
+        self._name = host.encode()[:64]
+
+    @contextmanager
+    def _synced(self):
+        with self._table.locked():
+            tokens, updated, blocked_until = self._table.load(self._slot)
+
+            # an unused slot keeps the full bucket this process started with
+            if updated:
+                self.tokens, self.updated, self.blocked_until = tokens, updated, blocked_until
+
+            yield
+            self._table.save(self._slot, self._name, self.tokens, self.updated, self.blocked_until)
+
+    def delay(self):
+        with self._synced():
+            return TokenBucket.delay(self)
+
+    def reserve(self, max_delay=None):
+        with self._synced():
+            return TokenBucket.reserve(self, max_delay)
+
+    def block(self, seconds):
+        with self._synced():
+            TokenBucket.block(self, seconds)
+
+    def clamp(self, remaining):
+        with self._synced():
+            TokenBucket.clamp(self, remaining)
+
+
+class SharedRateLimiter(RateLimiter):
+    """
+    :class:`RateLimiter` whose buckets are shared by every process on the host using the same file, so a pool of
+    worker processes draws from one budget per API host. Every process should use the same limits.
+
+    Takes the same arguments as :class:`RateLimiter`, plus:
+
+    Args:
+        path: File holding the shared buckets, created if it doesn't exist.
+        slots: Max number of hosts in the file.
+    """
+
+    def __init__(self, path, *args, slots=256, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.table = SharedBucketTable(path, slots)
+
+    def _new_bucket(self, host):
+        return SharedTokenBucket(self.table, host, *self._limits(host))
+
+    def close(self):
+        self.table.close()
@@ -0,0 +1,124 @@
+# Retrying of failed idempotent requests
+import asyncio
+import logging
+import random
+import time
+from collections import namedtuple
+from fnmatch import fnmatch
+
+import aiohttp
+from yarl import URL
+
+log = logging.getLogger(__name__)
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUSES = frozenset({500, 502, 503, 504})
+
+# errors that mean the request never got a usable response
+RETRY_EXCEPTIONS = (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError)
+
+RetryOptions = namedtuple("RetryOptions", ("retries", "backoff", "max_backoff", "statuses", "methods"))
+
+
+class RetryBudget:
+    """
+    Limits how many retries a client may make, so a broad outage doesn't turn into a retry storm.
+
+    Each request deposits ``ratio`` tokens and each retry withdraws one. The budget also refills at ``per_second``
+    tokens per second so low traffic clients can still retry, and never holds more than ``cap`` tokens.
+    """
+
+    def __init__(self, ratio=0.2, per_second=1.0, cap=20):
+        self.ratio = ratio
+        self.per_second = per_second
+        self.cap = cap
+
+        self.tokens = float(cap)
+        self.updated = time.monotonic()
+
+    def deposit(self):
+        self.tokens = min(self.cap, self.tokens + self.ratio)
+
+    def withdraw(self):
+        now = time.monotonic()
+        self.tokens = min(self.cap, self.tokens + (now - self.updated) * self.per_second)
+        self.updated = now
+
+        if self.tokens < 1:
+            return False
+
+        self.tokens -= 1
+        return True
+
+
+class RetryPolicy:
+    """
+    Retry policy applied by :class:`.Session` to idempotent requests that fail with a connection error, a timeout
+    or a transient 5xx response. Retries wait with exponential backoff and full jitter.
+
+    Args:
+        retries: Max number of retries per request.
+        backoff: Base delay in seconds. Retry ``n`` waits a random time up to ``backoff * 2 ** n``.
+        max_backoff: Upper limit for a single delay.
+        statuses: Response statuses that are retried.
+        methods: HTTP methods that are safe to retry.
+        budget: :class:`RetryBudget` shared by every request made with this policy.
+        overrides: Mapping of URL pattern to a dict of the options above, e.g.
+                   ``{"groups.roblox.com/v1/groups/*/users": {"retries": 10}}``. Patterns are matched against the
+                   host and path with :func:`fnmatch.fnmatch`, first match wins.
+
+    Attributes:
+        stats: Number of ``retries`` made, retries ``denied`` by the budget, requests that ``gave_up`` after
+               retrying and the total ``retry_time`` in seconds spent on requests after their first failure.
+    """
+
+    def __init__(self, retries=3, backoff=0.5, max_backoff=10.0, statuses=RETRY_STATUSES, methods=IDEMPOTENT_METHODS,
+                 budget=None, overrides=None):
+        self.default = RetryOptions(retries, backoff, max_backoff, frozenset(statuses),
+                                    frozenset(m.upper() for m in methods))
+        self.budget = budget or RetryBudget()
+        self.overrides = dict(overrides or {})
+
+        self.stats = {
+            "retries": 0,
+            "denied": 0,
+            "gave_up": 0,
+            "retry_time": 0.0
+        }
+
+    def options(self, url, retries=None):
+        """
+        Returns the :class:`RetryOptions` that apply to a URL. ``retries`` overrides the number of retries.
+        """
+
+        opts = self.default
+
+        if self.overrides:
+            url = URL(url)
+            target = "{}{}".format(url.host, url.path)
+
+            for pattern, override in self.overrides.items():
+                if fnmatch(target, pattern):
+                    opts = opts._replace(**override)
+                    break
+
+        if retries is not None:
+            opts = opts._replace(retries=retries)
+
+        return opts
+
+    def can_retry(self, method, attempt, opts):
+        # True if another attempt is allowed, takes a token from the budget
+
+        if method.upper() not in opts.methods or attempt >= opts.retries:
+            return False
+
+        if not self.budget.withdraw():
+            self.stats["denied"] += 1
+            log.warning("retry budget exhausted, not retrying")
+            return False
+
+        return True
+
+    def delay(self, attempt, opts):
+        return random.uniform(0, min(opts.max_backoff, opts.backoff * 2 ** attempt))
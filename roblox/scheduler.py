@@ -0,0 +1,121 @@
+# Priority and fair share scheduling of requests
+import asyncio
+import heapq
+import itertools
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+
+
+class Priority(IntEnum):
+    """
+    Request priority classes, lower values are served first.
+    """
+
+    interactive = 0
+    default = 1
+    bulk = 2
+
+
+# (priority, tenant) of the requests made in the current context
+_current = ContextVar("roblox_schedule", default=(Priority.default, None))
+
+
+def current():
+    return _current.get()
+
+
+@contextmanager
+def scheduling(priority=Priority.default, tenant=None):
+    """
+    Context manager that tags every request made inside it with a priority class and a tenant name::
+
+        with scheduling("interactive", tenant="commands"):
+            member = await group.get_member(name)
+    """
+
+    if isinstance(priority, str):
+        priority = Priority[priority]
+
+    token = _current.set((priority, tenant))
+    try:
+        yield
+    finally:
+        _current.reset(token)
+
+
+class Scheduler:
+    """
+    Limits the number of requests a :class:`.Session` has in flight and decides which waiting request goes next.
+
+    Higher priority classes always go first. Within a class, tenants share the slots by weighted fair queuing: a
+    tenant with weight 2 gets twice the requests of a tenant with weight 1 while both have requests waiting.
+    Requests are tagged with :func:`scheduling` or :meth:`.AsyncIterator.scheduled`.
+
+    Args:
+        max_inflight: Max number of requests in flight (including waits for the rate limit).
+        weights: Mapping of tenant name to weight. Tenants not listed have weight 1.
+
+    Attributes:
+        stats: Number of requests that were ``queued`` per priority class.
+    """
+
+    def __init__(self, max_inflight=16, weights=None):
+        self.max_inflight = max_inflight
+        self.weights = dict(weights or {})
+
+        self.inflight = 0
+
+        self._queue = []
+        self._seq = itertools.count()
+        self._finish = {}  # tenant -> virtual finish time of its last queued request
+        self._vtime = 0.0
+
+        self.stats = {p.name: 0 for p in Priority}
+
+    def __len__(self):
+        return sum(1 for item in self._queue if not item[-1].done())
+
+    async def acquire(self, priority=Priority.default, tenant=None):
+        """|coro|
+
+        Waits for a slot.
+        """
+
+        if self.inflight < self.max_inflight and not self._queue:
+            self.inflight += 1
+            return
+
+        priority = Priority(priority)
+        self.stats[priority.name] += 1
+
+        start = max(self._vtime, self._finish.get(tenant, 0.0))
+        finish = start + 1.0 / self.weights.get(tenant, 1)
+        self._finish[tenant] = finish
+
+        fut = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._queue, (priority, finish, next(self._seq), start, fut))
+
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # was handed a slot just before being cancelled
+                self.release()
+            raise
+
+    def release(self):
+        """
+        Frees a slot and hands it to the next waiting request.
+        """
+
+        self.inflight -= 1
+
+        while self._queue and self.inflight < self.max_inflight:
+            _, _, _, start, fut = heapq.heappop(self._queue)
+            if fut.done():  # cancelled while waiting
+                continue
+
+            self._vtime = max(self._vtime, start)
+            self.inflight += 1
+            fut.set_result(None)
@@ -0,0 +1,97 @@
+# Persistent on-disk store for entity payloads
+import json
+import logging
+import sqlite3
+import time
+
+log = logging.getLogger(__name__)
+
+# seconds each kind of payload is trusted for
+DEFAULT_TTLS = {
+    "username": 7 * 24 * 60 * 60,  # username -> id
+    "user": 24 * 60 * 60,
+    "group": 60 * 60,
+    "roles": 60 * 60,  # a group's role list
+    "role": 60 * 60,
+    "asset": 60 * 60,
+    "catalog": 10 * 60,  # catalog item details of an asset
+    "place": 60 * 60,
+    "universe": 10 * 60
+}
+
+
+class EntityStore:
+    """
+    SQLite backed store of the JSON payloads behind users, groups, roles, assets, places and universes, so they
+    survive restarts. Model loaders read through it: a payload younger than its kind's TTL is used instead of
+    requesting it again.
+
+    In offline mode stored payloads are served regardless of age and every request that would touch the network
+    raises :class:`.OfflineError`.
+
+    Args:
+        path: Database file. Opened in WAL mode so several processes can share it.
+        ttls: Mapping of kind to TTL in seconds, updating :data:`DEFAULT_TTLS`.
+        offline: Whether to serve only from the store.
+    """
+
+    def __init__(self, path, ttls=None, offline=False):
+        self.path = path
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.offline = offline
+
+        self.db = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute("CREATE TABLE IF NOT EXISTS entities ("
+                        "kind TEXT NOT NULL, key TEXT NOT NULL, data TEXT NOT NULL, stored REAL NOT NULL, "
+                        "PRIMARY KEY (kind, key))")
+
+    def __repr__(self):
+        return "EntityStore({!r}, offline={!r})".format(self.path, self.offline)
+
+    def get(self, kind, key):
+        """
+        Returns the stored payload for ``kind``/``key``, or ``None`` if there isn't one or it has expired.
+        """
+
+        row = self.db.execute("SELECT data, stored FROM entities WHERE kind = ? AND key = ?",
+                              (kind, str(key))).fetchone()
+        if row is None:
+            return None
+
+        data, stored = row
+        if not self.offline and time.time() - stored > self.ttls.get(kind, 0):
+            return None
+
+        return json.loads(data)
+
+    def put(self, kind, key, data):
+        self.db.execute("INSERT OR REPLACE INTO entities (kind, key, data, stored) VALUES (?, ?, ?, ?)",
+                        (kind, str(key), json.dumps(data), time.time()))
+
+    def delete(self, kind, key=None):
+        """
+        Deletes a stored payload, or every payload of a kind if no key is given.
+        """
+
+        if key is None:
+            self.db.execute("DELETE FROM entities WHERE kind = ?", (kind,))
+        else:
+            self.db.execute("DELETE FROM entities WHERE kind = ? AND key = ?", (kind, str(key)))
+
+    def purge(self):
+        """
+        Deletes every expired payload and returns how many were deleted.
+        """
+
+        now = time.time()
+        deleted = 0
+        for kind, ttl in self.ttls.items():
+            deleted += self.db.execute("DELETE FROM entities WHERE kind = ? AND stored < ?",
+                                       (kind, now - ttl)).rowcount
+
+        return deleted
+
+    def close(self):
+        self.db.close()
@@ -0,0 +1,60 @@
+# In-memory cache of resolved thumbnail URLs
+import time
+from collections import OrderedDict
+
+# thumbnails still being rendered are requested again this many times, this many seconds apart
+POLL_ATTEMPTS = 5
+POLL_INTERVAL = 1.0
+
+
+class ThumbnailCache:
+    """
+    LRU cache of thumbnail image URLs used by :meth:`.Session.get_thumbnails`. Thumbnails that are still pending
+    aren't cached.
+
+    Args:
+        ttl: Seconds a thumbnail URL is reused for. Avatars change when users change their outfit.
+        max_entries: Max number of cached URLs. Least recently used entries are evicted first.
+
+    Attributes:
+        stats: Number of ``hits`` and ``misses``.
+    """
+
+    def __init__(self, ttl=600.0, max_entries=10000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        self._entries = OrderedDict()  # key -> (expires, url)
+
+        self.stats = {
+            "hits": 0,
+            "misses": 0
+        }
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """
+        Returns ``(True, url)`` for a fresh entry, otherwise ``(False, None)``. The URL is ``None`` for thumbnails
+        that are blocked or failed to render.
+        """
+
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            self.stats["misses"] += 1
+            return False, None
+
+        self._entries.move_to_end(key)
+        self.stats["hits"] += 1
+        return True, entry[1]
+
+    def put(self, key, url):
+        self._entries[key] = (time.monotonic() + self.ttl, url)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
@@ -0,0 +1,267 @@
+# HTTP client libraries that Session sends its requests with
+import asyncio
+import http.cookiejar
+import json
+from abc import ABCMeta, abstractmethod
+from http.cookies import Morsel
+
+import aiohttp
+from yarl import URL
+
+try:
+    import httpx
+except ImportError:  # optional, pip install roblox.py[http2]
+    httpx = None
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 6.1; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/60.0.3112.90 Saf" \
+             "ari/537.36"
+
+
+class Transport(metaclass=ABCMeta):
+    """
+    Interface between :class:`.Session` and the HTTP client library that sends its requests.
+
+    Responses must look like :class:`aiohttp.ClientResponse` to the endpoint methods: ``method``, ``url``,
+    ``status``, ``reason``, ``headers``, ``charset``, ``release()`` and the coroutines ``read()``, ``text()`` and
+    ``json()``. Connection errors are raised as :class:`aiohttp.ClientConnectionError` and timeouts as
+    :class:`asyncio.TimeoutError`, so retries and circuit breakers treat every transport the same.
+
+    Attributes:
+        cookie_jar: The transport's cookies, iterable as :class:`http.cookies.Morsel` objects and updated with
+                    ``update_cookies(cookies)`` like :class:`aiohttp.CookieJar`.
+    """
+
+    cookie_jar = None
+
+    @abstractmethod
+    async def request(self, method, url, *, params=None, headers=None, data=None, json=None, proxy=None,
+                      timeout=None, allow_redirects=True):
+        """|coro|
+
+        Sends a request and returns its response. ``timeout`` is in seconds.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    def fork(self, cookies=None):
+        """
+        Returns a transport with its own cookies that shares this one's connections. Used for pooled accounts.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def close(self):
+        raise NotImplementedError
+
+
+class AiohttpTransport(Transport):
+    """
+    Default transport, sending HTTP/1.1 requests with an :class:`aiohttp.ClientSession`.
+
+    Args:
+        connector: Connection pool to use, see :func:`.make_connector`.
+        cookies: Initial cookies.
+        owner: Whether closing the transport closes the connector.
+    """
+
+    def __init__(self, connector=None, cookies=None, owner=True):
+        self.connector = connector
+        self.session = aiohttp.ClientSession(headers={
+            "User-Agent": USER_AGENT
+        }, cookies=cookies, connector=connector, connector_owner=owner)
+
+    @property
+    def cookie_jar(self):
+        return self.session.cookie_jar
+
+    async def request(self, method, url, timeout=None, **kwargs):
+        if timeout is not None:
+            kwargs["timeout"] = aiohttp.ClientTimeout(total=timeout)
+
+        return await self.session.request(method, url, **kwargs)
+
+    def fork(self, cookies=None):
+        return AiohttpTransport(self.session.connector, cookies, owner=False)
+
+    async def close(self):
+        await self.session.close()
+
+
+class HTTPXResponse:
+    """
+    :class:`httpx.Response` with the parts of the :class:`aiohttp.ClientResponse` interface the endpoint methods
+    use. The body is read before the response is returned, so releasing it does nothing.
+    """
+
+    __slots__ = ("_resp", "method", "url", "status", "reason", "headers", "charset")
+
+    def __init__(self, resp):
+        self._resp = resp
+
+        self.method = resp.request.method
+        self.url = URL(str(resp.url))
+        self.status = resp.status_code
+        self.reason = resp.reason_phrase
+        self.headers = resp.headers
+        self.charset = resp.charset_encoding
+
+    def __repr__(self):
+        return "<HTTPXResponse [{} {}] {}>".format(self.status, self.reason, self.url)
+
+    def release(self):
+        pass
+
+    async def read(self):
+        return self._resp.content
+
+    async def text(self, encoding=None):
+        return self._resp.content.decode(encoding or self.charset or "utf-8")
+
+    async def json(self):
+        if not self._resp.content.strip():
+            return None
+
+        return json.loads(self._resp.content)
+
+
+class HTTPXCookieJar:
+    # aiohttp CookieJar interface over the http.cookiejar.CookieJar that httpx uses
+
+    def __init__(self, jar):
+        self.jar = jar
+
+    def __iter__(self):
+        for cookie in self.jar:
+            morsel = Morsel()
+            morsel.set(cookie.name, cookie.value, cookie.value)
+            morsel["domain"] = cookie.domain if cookie.domain_specified else ""
+            morsel["path"] = cookie.path
+            morsel["secure"] = cookie.secure
+            morsel["httponly"] = cookie.has_nonstandard_attr("HttpOnly")
+            if cookie.expires is not None:
+                morsel["expires"] = http.cookiejar.time2netscape(cookie.expires)
+
+            yield morsel
+
+    def __len__(self):
+        return len(self.jar)
+
+    def update_cookies(self, cookies):
+        for name, value in cookies.items():
+            morsel = value if isinstance(value, Morsel) else None
+            value = morsel.value if morsel is not None else value
+            domain = (morsel and morsel["domain"]) or ""
+            path = (morsel and morsel["path"]) or "/"
+
+            expires = None
+            if morsel is not None and morsel["expires"]:
+                expires = http.cookiejar.http2time(morsel["expires"])
+
+            self.jar.set_cookie(http.cookiejar.Cookie(
+                version=0, name=name, value=value, port=None, port_specified=False,
+                domain=domain, domain_specified=bool(domain), domain_initial_dot=domain.startswith("."),
+                path=path, path_specified=True, secure=bool(morsel and morsel["secure"]), expires=expires,
+                discard=expires is None, comment=None, comment_url=None,
+                rest={"HttpOnly": None} if morsel is not None and morsel["httponly"] else {}
+            ))
+
+
+class HTTPXTransport(Transport):
+    """
+    Transport sending requests with :mod:`httpx`, multiplexing concurrent requests to a host over a few HTTP/2
+    connections instead of opening one connection per request in flight. Requires ``httpx[http2]``
+    (``pip install roblox.py[http2]``).
+
+    httpx costs more CPU per request than aiohttp, so this pays off when connections are expensive (many hosts,
+    high latency, proxies) rather than on a fast local link.
+
+    Args:
+        http2: Whether to negotiate HTTP/2. Hosts that don't support it fall back to HTTP/1.1.
+        max_connections: Max number of open connections in total.
+        keepalive_timeout: Seconds an idle connection is kept open for reuse.
+        cookies: Initial cookies.
+    """
+
+    def __init__(self, http2=True, max_connections=100, keepalive_timeout=30.0, cookies=None, _shared=None):
+        if httpx is None:
+            raise RuntimeError("HTTPXTransport requires httpx, install it with pip install roblox.py[http2]")
+
+        self.http2 = http2
+        self.max_connections = max_connections
+        self.keepalive_timeout = keepalive_timeout
+
+        # connection pools by proxy URL, shared by forks
+        self._pools = {} if _shared is None else _shared
+        self._owner = _shared is None
+        self._clients = {}
+
+        self.cookie_jar = HTTPXCookieJar(http.cookiejar.CookieJar())
+        if cookies:
+            self.cookie_jar.update_cookies(cookies)
+
+    def _pool(self, proxy):
+        pool = self._pools.get(proxy)
+        if pool is None:
+            pool = self._pools[proxy] = httpx.AsyncHTTPTransport(
+                http2=self.http2, proxy=proxy, limits=httpx.Limits(max_connections=self.max_connections,
+                                                                   keepalive_expiry=self.keepalive_timeout))
+
+        return pool
+
+    def _client(self, proxy):
+        # clients share the cookie jar, proxies are per client in httpx
+        client = self._clients.get(proxy)
+        if client is None:
+            client = self._clients[proxy] = httpx.AsyncClient(
+                transport=self._pool(proxy), cookies=self.cookie_jar.jar, headers={"User-Agent": USER_AGENT},
+                timeout=None)
+
+        return client
+
+    async def request(self, method, url, *, data=None, proxy=None, timeout=None, allow_redirects=True,
+                      **kwargs):
+        if isinstance(data, aiohttp.FormData):
+            kwargs["data"], kwargs["files"] = self._multipart(data)
+        elif isinstance(data, (str, bytes)):
+            kwargs["content"] = data
+        elif data is not None:
+            kwargs["data"] = data
+
+        try:
+            resp = await self._client(proxy).request(method, str(url), follow_redirects=allow_redirects,
+                                                     timeout=timeout, **kwargs)
+        except httpx.TimeoutException as e:
+            raise asyncio.TimeoutError(str(e) or type(e).__name__) from e
+        except httpx.TransportError as e:
+            raise aiohttp.ClientConnectionError(str(e) or type(e).__name__) from e
+
+        return HTTPXResponse(resp)
+
+    @staticmethod
+    def _multipart(form):
+        # aiohttp.FormData doesn't expose its fields, so this reads them from the same attribute aiohttp does
+
+        data, files = {}, []
+        for options, headers, value in form._fields:
+            name = options["name"]
+
+            if "filename" in options or not isinstance(value, str):
+                content_type = headers.get("Content-Type", "application/octet-stream")
+                files.append((name, (options.get("filename", name), value, content_type)))
+            else:
+                data[name] = value
+
+        return data, files
+
+    def fork(self, cookies=None):
+        return HTTPXTransport(self.http2, self.max_connections, self.keepalive_timeout, cookies, self._pools)
+
+    async def close(self):
+        self._clients.clear()
+
+        if self._owner:
+            for pool in self._pools.values():
+                await pool.aclose()
+            self._pools.clear()
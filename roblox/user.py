@@ -9,6 +9,7 @@ from cached_property import cached_property
 from roblox.abc import User as _BaseUser
 from roblox.abc import ClientUser as _ClientUser
 from roblox.abc import OtherUser as _User
+from roblox.enums import PresenceType
 from roblox.errors import *
 from roblox.http import Session
 from roblox.iterables import AsyncIterator
@@ -63,7 +64,8 @@ class BaseUser(_BaseUser):  # _BaseUser):
         self._data.update(data)
 
     async def _get_profile_data(self):
-        new = await self._state.get_user_data(await self.id)
+        user_id = await self.id
+        new = await self._state.stored("user", user_id, lambda: self._state.get_user_data(user_id))
         self._update(new)
 
     @async_cached_property
@@ -76,7 +78,9 @@ class BaseUser(_BaseUser):  # _BaseUser):
         """
 
         if self._data["id"] is None:
-            new = await self._state.get_by_username(self._data["username"])
+            username = self._data["username"]
+            new = await self._state.stored("username", username.lower(),
+                                           lambda: self._state.get_by_username(username))
             self._update(new)
 
         return self._data["id"]
@@ -91,7 +95,7 @@ class BaseUser(_BaseUser):  # _BaseUser):
         """
 
         if self._data["username"] is None:
-            await self._get_profile_data()
+            self._update(dict(await self._state.get_user_summary(await self.id)))
 
         return self._data["username"] or self._data["name"]
 
@@ -172,6 +176,45 @@ class BaseUser(_BaseUser):  # _BaseUser):
 
         return await self._state.is_premium(await self.id)
 
+    async def presence(self):
+        """|coro|
+
+        Where the user is currently online.
+
+        :rtype: :class:`.Presence`
+        """
+
+        return Presence(await self._state.get_presence(await self.id))
+
+    async def thumbnail(self, size="420x420", format="Png"):
+        """|coro|
+
+        URL of an image of the user's full avatar, or ``None`` if it isn't available.
+
+        Args:
+            size: Image size, e.g. ``"420x420"``.
+            format: ``"Png"`` or ``"Jpeg"``.
+
+        :rtype: str
+        """
+
+        return await self._state.get_thumbnail("thumbnails.avatar", await self.id, size, format)
+
+    async def headshot(self, size="150x150", format="Png", circular=False):
+        """|coro|
+
+        URL of an image of the user's avatar's head, or ``None`` if it isn't available.
+
+        Args:
+            size: Image size, e.g. ``"150x150"``.
+            format: ``"Png"`` or ``"Jpeg"``.
+            circular: Whether the image is cropped to a circle.
+
+        :rtype: str
+        """
+
+        return await self._state.get_thumbnail("thumbnails.headshot", await self.id, size, format, circular)
+
     async def _friends_iter(self):
         data = await self._state.get_user_friends(await self.id)
         return [User(state=self._state, data=friend) for friend in data]
@@ -395,6 +438,61 @@ class User(BaseUser, _User):
         log.debug("unfriended {}".format(self))
 
 
+class Presence:
+    """
+    Where a user is online, as seen at one point in time. Two presences are equal if the user is in the same place,
+    regardless of when they were last online.
+
+    Attributes:
+        user_id: The user's ID.
+        type: :class:`.PresenceType`.
+        location: Description of where the user is, e.g. ``"Website"`` or the name of a game.
+        place_id: ID of the place the user is in, if visible to the client.
+        universe_id: ID of the universe the user is in, if visible to the client.
+        game_id: ID of the server the user is in, if visible to the client.
+    """
+
+    __slots__ = ("user_id", "type", "location", "place_id", "universe_id", "game_id", "_last_online")
+
+    def __init__(self, data):
+        self.user_id = data["userId"]
+        self.type = PresenceType(data["userPresenceType"])
+        self.location = data.get("lastLocation")
+        self.place_id = data.get("placeId")
+        self.universe_id = data.get("universeId")
+        self.game_id = data.get("gameId")
+        self._last_online = data.get("lastOnline")
+
+    def __repr__(self):
+        return "Presence({!r}, {})".format(self.user_id, self.type.name)
+
+    def _key(self):
+        return self.user_id, self.type, self.location, self.place_id, self.universe_id, self.game_id
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __eq__(self, other):
+        if not isinstance(other, Presence):
+            return False
+
+        return self._key() == other._key()
+
+    @property
+    def last_online(self):
+        """
+        :class:`datetime.datetime` at which the user was last online.
+        """
+
+        if self._last_online is None:
+            return None
+
+        try:
+            return maya.parse(self._last_online).datetime()
+        except OSError:
+            return None
+
+
 class FriendRequest(User):
     """Represents a user requesting friendship with the client. This class is used to provide accept/decline methods
     while still allowing you to get user data."""
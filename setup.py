@@ -21,5 +21,8 @@ setup(
     license="MIT",
     packages=["roblox"],
     install_requires=requires,
+    extras_require={
+        "http2": ["httpx[http2]"]
+    },
     include_package_data=True
 )
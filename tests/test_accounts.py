@@ -0,0 +1,50 @@
+import asyncio
+import socket
+
+from aiohttp import web
+
+from roblox.endpoints import Endpoint
+from roblox.http import Session
+
+
+def test_pinned_reads_use_the_primary_account():
+    async def run():
+        cookies = []
+
+        async def handler(request):
+            cookies.append(request.cookies.get(".ROBLOSECURITY"))
+            return web.json_response({"count": 0})
+
+        app = web.Application()
+        app.router.add_get("/{path:.*}", handler)
+
+        runner = web.AppRunner(app)
+        await runner.setup()
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        await web.TCPSite(runner, "127.0.0.1", port).start()
+
+        base = "http://127.0.0.1:{}".format(port)
+        pinned = Endpoint("test.pinned", "get", base + "/my/requests/count", cache=False, pinned=True)
+        public = Endpoint("test.public", "get", base + "/users/1", cache=False)
+
+        session = Session(coalesce=False)
+        session.session.cookie_jar.update_cookies({".ROBLOSECURITY": "primary"})
+        session.accounts.add("alt", session.session.fork({".ROBLOSECURITY": "alt"}))
+
+        try:
+            for ep in (pinned, public):
+                for _ in range(4):
+                    async with session.req(ep.method, ep.url(), cache=ep.cache, pinned=ep.pinned) as resp:
+                        assert resp.status == 200
+        finally:
+            await session.close()
+            await runner.cleanup()
+
+        return cookies
+
+    cookies = asyncio.run(run())
+
+    assert cookies[:4] == ["primary"] * 4
+    assert set(cookies[4:]) == {"primary", "alt"}
@@ -0,0 +1,45 @@
+import asyncio
+
+from roblox.asset import Asset
+from roblox.errors import AssetNotFound
+from roblox.http import Session
+
+
+def _calls(item, prop):
+    async def run():
+        calls = []
+        session = Session()
+
+        async def load_catalog_details(asset_id):
+            calls.append("cat")
+            if item is None:
+                raise AssetNotFound(asset_id)
+            return dict(item, id=asset_id, itemType="Asset")
+
+        async def product_info(asset_id):
+            calls.append("pi")
+            return {"AssetId": asset_id, "Name": "Hat", "Description": "A hat", "PriceInRobux": None}
+
+        session.load_catalog_details = load_catalog_details
+        session.product_info = product_info
+
+        try:
+            value = await getattr(Asset(state=session, data={"id": 1}), prop)
+        finally:
+            await session.close()
+
+        return calls, value
+
+    return asyncio.run(run())
+
+
+def test_off_sale_catalog_price_stays_in_the_batch():
+    assert _calls({"name": "Hat", "description": "A hat", "price": None, "isOffSale": True}, "price") == (["cat"], None)
+
+
+def test_missing_catalog_field_falls_back_to_product_info():
+    assert _calls({"name": "Hat", "price": 5}, "description") == (["cat", "pi"], "A hat")
+
+
+def test_null_product_info_field_is_not_fetched_twice():
+    assert _calls(None, "price") == (["cat", "pi"], None)
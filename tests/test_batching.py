@@ -0,0 +1,51 @@
+import asyncio
+
+from roblox.batching import Batcher
+from roblox.deadline import deadline, remaining
+from roblox.errors import DeadlineExceeded
+from roblox.scheduler import Priority, current, scheduling
+
+
+def test_batch_takes_the_most_urgent_schedule():
+    seen = []
+
+    async def fetch(keys):
+        seen.append((sorted(keys), current()))
+        return {key: key * 2 for key in keys}
+
+    async def run():
+        batcher = Batcher(fetch, max_size=10, window=0.01)
+
+        async def load(key, priority, tenant):
+            with scheduling(priority, tenant):
+                return await batcher.load(key)
+
+        return await asyncio.gather(load(1, "bulk", "crawler"), load(2, "interactive", "commands"),
+                                    load(3, "default", None))
+
+    assert asyncio.run(run()) == [2, 4, 6]
+    assert seen == [([1, 2, 3], (Priority.interactive, "commands"))]
+
+
+def test_batch_outlives_the_first_callers_deadline():
+    deadlines = []
+
+    async def fetch(keys):
+        deadlines.append(remaining())
+        await asyncio.sleep(0.1)
+        return {key: key for key in keys}
+
+    async def run():
+        batcher = Batcher(fetch, window=0.01)
+
+        async def hurried():
+            with deadline(0.05):
+                return await batcher.load(1)
+
+        return await asyncio.gather(hurried(), batcher.load(2), return_exceptions=True)
+
+    hurried, patient = asyncio.run(run())
+
+    assert isinstance(hurried, DeadlineExceeded)
+    assert patient == 2
+    assert deadlines == [None]
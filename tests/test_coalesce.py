@@ -0,0 +1,83 @@
+import asyncio
+import socket
+
+from aiohttp import web
+
+from roblox.deadline import deadline
+from roblox.errors import DeadlineExceeded
+from roblox.http import Session
+from roblox.ratelimit import RateLimiter
+from roblox.scheduler import Priority, Scheduler, scheduling
+
+
+class RecordingScheduler(Scheduler):
+    def __init__(self):
+        super().__init__()
+        self.tags = []
+
+    async def acquire(self, priority=Priority.default, tenant=None):
+        self.tags.append((priority, tenant))
+        await super().acquire(priority, tenant)
+
+
+async def _serve():
+    async def user(request):
+        return web.json_response({"id": 1})
+
+    app = web.Application()
+    app.router.add_get("/v1/users/1", user)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    await web.TCPSite(runner, "127.0.0.1", port).start()
+
+    return runner, "http://127.0.0.1:{}/v1/users/1".format(port)
+
+
+def test_coalesced_get_keeps_its_scheduling():
+    async def run():
+        runner, url = await _serve()
+        session = Session(scheduler=RecordingScheduler())
+
+        try:
+            with scheduling("interactive", tenant="commands"):
+                async with session.req("get", url) as resp:
+                    assert resp.status == 200
+        finally:
+            await session.close()
+            await runner.cleanup()
+
+        return session.scheduler.tags
+
+    assert asyncio.run(run()) == [(Priority.interactive, "commands")]
+
+
+def test_coalesced_get_outlives_the_first_callers_deadline():
+    async def run():
+        runner, url = await _serve()
+        session = Session(rate_limiter=RateLimiter(rate=2, burst=1))
+        session.rate_limiter.bucket("127.0.0.1").reserve()  # the next request waits 0.5s
+
+        async def hurried():
+            with deadline(0.1):
+                async with session.req("get", url) as resp:
+                    return resp.status
+
+        async def patient():
+            async with session.req("get", url) as resp:
+                return resp.status
+
+        try:
+            return await asyncio.gather(hurried(), patient(), return_exceptions=True)
+        finally:
+            await session.close()
+            await runner.cleanup()
+
+    hurried, patient = asyncio.run(run())
+
+    assert isinstance(hurried, DeadlineExceeded)
+    assert patient == 200
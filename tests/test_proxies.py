@@ -0,0 +1,125 @@
+import asyncio
+import socket
+
+import aiohttp
+from aiohttp import web
+
+from roblox.http import Session
+from roblox.proxies import ProxyPool
+from roblox.retry import RetryPolicy
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _serve(app):
+    runner = web.AppRunner(app)
+    await runner.setup()
+
+    port = _free_port()
+    await web.TCPSite(runner, "127.0.0.1", port).start()
+
+    return runner, port
+
+
+async def _origin(request):
+    return web.json_response({"id": 1, "via": request.headers.get("Via")})
+
+
+def _stand_in_proxy(forwarded):
+    # plain HTTP forward proxy: requests arrive with the absolute URL of the origin
+
+    async def forward(request):
+        forwarded.append(str(request.url))
+
+        async with aiohttp.ClientSession() as session:
+            async with session.request(request.method, str(request.url), headers={"Via": "stand-in"}) as resp:
+                return web.Response(status=resp.status, body=await resp.read(), content_type=resp.content_type)
+
+    app = web.Application()
+    app.router.add_route("*", "/{path:.*}", forward)
+    return app
+
+
+def test_dead_proxy_is_ejected_and_requests_fail_over():
+    async def run():
+        origin = web.Application()
+        origin.router.add_get("/v1/users/1", _origin)
+        origin_runner, origin_port = await _serve(origin)
+
+        forwarded = []
+        proxy_runner, proxy_port = await _serve(_stand_in_proxy(forwarded))
+
+        dead = "http://127.0.0.1:{}".format(_free_port())
+        live = "http://127.0.0.1:{}".format(proxy_port)
+        pool = ProxyPool([dead, live], max_failures=1, eject_for=60.0)
+
+        session = Session(proxies=pool, retry_policy=RetryPolicy(retries=3, backoff=0.01))
+        url = "http://127.0.0.1:{}/v1/users/1".format(origin_port)
+
+        try:
+            for _ in range(4):
+                async with session.req("get", url, cache=False) as resp:
+                    assert resp.status == 200
+                    assert (await resp.json())["via"] == "stand-in"
+        finally:
+            await session.close()
+            await proxy_runner.cleanup()
+            await origin_runner.cleanup()
+
+        return pool, dead, live, forwarded
+
+    pool, dead, live, forwarded = asyncio.run(run())
+    stats = pool.stats()
+
+    assert stats[dead]["ejected"]
+    assert stats[dead]["requests"] == 1
+    assert not stats[live]["ejected"]
+    assert stats[live]["requests"] == 4
+    assert len(forwarded) == 4
+
+
+def test_sticky_keys_keep_their_proxy_until_ejected():
+    pool = ProxyPool(["http://a:1", "http://b:1"], max_failures=1)
+
+    first = pool.assign("alice")
+    assert all(pool.assign("alice") is first for _ in range(5))
+
+    pool.record(first, True)
+    assert first.ejected
+    assert pool.assign("alice") is not first
+
+
+def test_warmup_connects_through_each_proxy():
+    async def run():
+        tunnels = []
+
+        async def tunnel(reader, writer):
+            # records the CONNECT and refuses it, the warm-up only has to reach the proxy
+            tunnels.append((writer.get_extra_info("sockname")[1], (await reader.readline()).decode().split()[:2]))
+            writer.write(b"HTTP/1.1 502 Bad Gateway\r\nContent-Length: 0\r\n\r\n")
+            await writer.drain()
+            writer.close()
+
+        servers = [await asyncio.start_server(tunnel, "127.0.0.1", 0) for _ in range(2)]
+        ports = [server.sockets[0].getsockname()[1] for server in servers]
+
+        session = Session(proxies=["http://127.0.0.1:{}".format(port) for port in ports])
+
+        try:
+            timings = await session.warmup(["users.roblox.com"], timeout=5.0)
+        finally:
+            await session.close()
+            for server in servers:
+                server.close()
+                await server.wait_closed()
+
+        return ports, tunnels, timings
+
+    ports, tunnels, timings = asyncio.run(run())
+
+    assert sorted(tunnels) == [(port, ["CONNECT", "users.roblox.com:443"]) for port in sorted(ports)]
+    assert isinstance(timings["users.roblox.com"], aiohttp.ClientError)
@@ -0,0 +1,57 @@
+import asyncio
+import multiprocessing
+import time
+
+from roblox.ratelimit import SharedRateLimiter
+
+RATE = 50.0
+PROCESSES = 4
+ACQUISITIONS = 25
+
+
+def _worker(path, barrier, times):
+    limiter = SharedRateLimiter(path, rate=RATE, burst=1)
+
+    async def run():
+        for _ in range(ACQUISITIONS):
+            await limiter.acquire("users.roblox.com")
+            times.append(time.time())
+
+    barrier.wait()
+    asyncio.run(run())
+    limiter.close()
+
+
+def test_processes_share_one_rate(tmp_path):
+    ctx = multiprocessing.get_context("spawn")
+    path = str(tmp_path / "ratelimit")
+
+    with ctx.Manager() as manager:
+        barrier = manager.Barrier(PROCESSES)
+        times = manager.list()
+
+        workers = [ctx.Process(target=_worker, args=(path, barrier, times)) for _ in range(PROCESSES)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(30)
+            assert worker.exitcode == 0
+
+        times = sorted(times)
+
+    total = PROCESSES * ACQUISITIONS
+    assert len(times) == total
+
+    # one shared bucket: every acquisition after the first waits for its own token
+    expected = (total - 1) / RATE
+    elapsed = times[-1] - times[0]
+
+    assert elapsed >= expected * 0.9
+    assert elapsed < expected * 1.5
+
+
+def test_unused_hosts_start_full(tmp_path):
+    limiter = SharedRateLimiter(str(tmp_path / "ratelimit"), rate=RATE, burst=5)
+
+    assert asyncio.run(limiter.acquire("groups.roblox.com")) == 0
+    limiter.close()